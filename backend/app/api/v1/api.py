@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query
 
+from backend.app.common.conditional import ConditionalGet
 from backend.app.common.jwt import DependsJwtAuth
 from backend.app.common.pagination import DependsPagination, paging_data
 from backend.app.common.permission import RequestPermission
@@ -16,7 +17,11 @@ from backend.app.services.api_service import api_service
 router = APIRouter()
 
 
-@router.get("/all", summary="모든 인터페이스 가져 오기", dependencies=[DependsJwtAuth])
+@router.get(
+    "/all",
+    summary="모든 인터페이스 가져 오기",
+    dependencies=[DependsJwtAuth, Depends(ConditionalGet("api"))],
+)
 async def get_all_apis() -> ResponseModel:
     data = await api_service.get_api_list()
     return await response_base.success(data=data)
@@ -23,9 +23,12 @@ router = APIRouter()
     deprecated=True,
 )
 async def swagger_user_login(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> GetSwaggerToken:
-    token, user = await auth_service.swagger_login(form_data=form_data)
+    token, user = await auth_service.swagger_login(
+        form_data=form_data, background_tasks=background_tasks
+    )
     return GetSwaggerToken(access_token=token, user=user)  # type: ignore
 
 
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, Request
 from fastapi_limiter.depends import RateLimiter
 from starlette.concurrency import run_in_threadpool
 
+from backend.app.common.captcha_pool import captcha_pool
 from backend.app.common.redis import redis_client
 from backend.app.common.response.response_schema import ResponseModel, response_base
 from backend.app.core.conf import settings
@@ -19,11 +20,14 @@ router = APIRouter()
 )
 async def get_captcha(request: Request) -> ResponseModel:
     """
-    이 인터페이스는 성능 손실이 있을 수 있으며, 비동기 인터페이스이지만, 인증 코드 생성은 IO 집약적인 작업이므로 성능 손실을 최소화하기 위해 스레드 풀을 사용합니다.
+    인증 코드 생성은 CPU 집약적인 작업이므로, 사전 생성 풀이 활성화된 경우 풀에서 꺼내고 그렇지 않으면 스레드 풀에서 생성합니다.
     """
     img_type: str = "base64"
-    img, code = await run_in_threadpool(img_captcha, img_byte=img_type)
     ip = request.state.ip
+    if settings.CAPTCHA_POOL:
+        img = await captcha_pool.pop(ip)
+        return await response_base.success(data={"image_type": img_type, "image": img})
+    img, code = await run_in_threadpool(img_captcha, img_byte=img_type)
     await redis_client.set(
         f"{settings.CAPTCHA_LOGIN_REDIS_PREFIX}:{ip}",
         code,
@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query
 
+from backend.app.common.conditional import ConditionalGet
 from backend.app.common.jwt import DependsJwtAuth
 from backend.app.common.permission import RequestPermission
 from backend.app.common.rbac import DependsRBAC
@@ -26,7 +27,11 @@ async def get_dept(pk: Annotated[int, Path(...)]) -> ResponseModel:
     return await response_base.success(data=data)
 
 
-@router.get("", summary="모든 부서 트리 가져오기", dependencies=[DependsJwtAuth])
+@router.get(
+    "",
+    summary="모든 부서 트리 가져오기",
+    dependencies=[DependsJwtAuth, Depends(ConditionalGet("dept"))],
+)
 async def get_all_depts_tree(
     name: Annotated[str | None, Query()] = None,
     leader: Annotated[str | None, Query()] = None,
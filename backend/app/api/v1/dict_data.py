@@ -2,8 +2,9 @@
 # -*- coding: utf-8 -*-
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Header, Path, Query, Response
 
+from backend.app.common.conditional import etag_matches
 from backend.app.common.jwt import DependsJwtAuth
 from backend.app.common.pagination import DependsPagination, paging_data
 from backend.app.common.permission import RequestPermission
@@ -21,6 +22,25 @@ from backend.app.utils.serializers import select_as_dict
 router = APIRouter()
 
 
+@router.get(
+    "/by-type/{code}",
+    summary="사전 유형 코드로 모든 사전 데이터 가져오기",
+    dependencies=[DependsJwtAuth],
+)
+async def get_dict_datas_by_type(
+    code: Annotated[str, Path(...)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    캐시된 스냅샷을 그대로 반환하며, If-None-Match 가 현재 ETag 와 일치하면 304 를 반환합니다.
+    """
+    snapshot = await dict_data_service.get_by_type_code(code=code)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.content, media_type="application/json", headers=headers)
+
+
 @router.get("/{pk}", summary="사전 세부 정보 가져오기", dependencies=[DependsJwtAuth])
 async def get_dict_data(pk: Annotated[int, Path(...)]) -> ResponseModel:
     dict_data = await dict_data_service.get(pk=pk)
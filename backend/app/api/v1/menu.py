@@ -4,27 +4,32 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query, Request
 
+from backend.app.common.conditional import ConditionalGet
 from backend.app.common.jwt import DependsJwtAuth
 from backend.app.common.permission import RequestPermission
 from backend.app.common.rbac import DependsRBAC
 from backend.app.common.response.response_schema import ResponseModel, response_base
+from backend.app.schemas import structs
 from backend.app.schemas.menu import (
     CreateMenuParam,
     GetMenuListDetails,
     UpdateMenuParam,
 )
 from backend.app.services.menu_service import menu_service
-from backend.app.utils.serializers import select_as_dict
+from backend.app.utils.serializers import select_as_dict, struct_convert
 
 router = APIRouter()
 
 
 @router.get(
-    "/sidebar", summary="사용자 메뉴 트리 가져오기", dependencies=[DependsJwtAuth]
+    "/sidebar",
+    summary="사용자 메뉴 트리 가져오기",
+    dependencies=[DependsJwtAuth, Depends(ConditionalGet("menu", "role", per_user=True))],
 )
 async def get_user_menus(request: Request) -> ResponseModel:
     menu = await menu_service.get_user_menu_tree(request=request)
-    return await response_base.success(data=menu)
+    data = struct_convert(menu, list[structs.GetMenuTreeDetails])
+    return await response_base.fast_success(data=data)
 
 
 @router.get("/{pk}", summary="메뉴 세부 정보 가져오기", dependencies=[DependsJwtAuth])
@@ -40,7 +45,8 @@ async def get_all_menus(
     status: Annotated[int | None, Query()] = None,
 ) -> ResponseModel:
     menu = await menu_service.get_menu_tree(title=title, status=status)
-    return await response_base.success(data=menu)
+    data = struct_convert(menu, list[structs.GetMenuTreeDetails])
+    return await response_base.fast_success(data=data)
 
 
 @router.post(
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from fastapi import APIRouter, Depends
+
+from backend.app.common.jwt import DependsJwtAuth
+from backend.app.common.permission import RequestPermission
+from backend.app.common.response.response_schema import ResponseModel, response_base
+from backend.app.database.db_mysql import async_db_session, async_engine
+
+router = APIRouter()
+
+
+@router.get(
+    "/database",
+    summary="데이터베이스 연결 풀 감시 장치",
+    dependencies=[
+        Depends(RequestPermission("sys:monitor:database")),
+        DependsJwtAuth,
+    ],
+)
+async def get_database_pool_info() -> ResponseModel:
+    """현재 워커 프로세스의 연결 풀 상태와 체크아웃 대기 시간 히스토그램"""
+    data = {
+        "pool": async_engine.pool.status_snapshot(),
+        "replicas": [engine.pool.status_snapshot() for engine in async_db_session.kw["replicas"].engines],
+    }
+    return await response_base.success(data=data)
@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query, Request
 
+from backend.app.common.conditional import ConditionalGet
 from backend.app.common.jwt import DependsJwtAuth
 from backend.app.common.pagination import DependsPagination, paging_data
 from backend.app.common.permission import RequestPermission
@@ -23,7 +24,11 @@ from backend.app.utils.serializers import select_as_dict, select_list_serialize
 router = APIRouter()
 
 
-@router.get("/all", summary="모든 역할 가져오기", dependencies=[DependsJwtAuth])
+@router.get(
+    "/all",
+    summary="모든 역할 가져오기",
+    dependencies=[DependsJwtAuth, Depends(ConditionalGet("role"))],
+)
 async def get_all_roles() -> ResponseModel:
     roles = await role_service.get_all()
     data = await select_list_serialize(roles)
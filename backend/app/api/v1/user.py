@@ -4,12 +4,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query, Request
 
+from backend.app.common.conditional import ConditionalGet
 from backend.app.common.jwt import DependsJwtAuth
 from backend.app.common.pagination import DependsPagination, paging_data
 from backend.app.common.permission import RequestPermission
 from backend.app.common.rbac import DependsRBAC
 from backend.app.common.response.response_schema import ResponseModel, response_base
 from backend.app.database.db_mysql import CurrentSession
+from backend.app.schemas import structs
 from backend.app.schemas.user import (
     AddUserParam,
     AvatarParam,
@@ -53,7 +55,7 @@ async def password_reset(request: Request, obj: ResetPasswordParam) -> ResponseM
 @router.get(
     "/me",
     summary="현재 사용자 정보 가져오기",
-    dependencies=[DependsJwtAuth],
+    dependencies=[DependsJwtAuth, Depends(ConditionalGet("dept", "role", per_user=True))],
     response_model_exclude={"password"},
 )
 async def get_current_userinfo(request: Request) -> ResponseModel:
@@ -129,8 +131,8 @@ async def get_pagination_users(
     user_select = await user_service.get_select(
         dept=dept, username=username, phone=phone, status=status
     )
-    page_data = await paging_data(db, user_select, GetUserInfoListDetails)
-    return await response_base.success(data=page_data)
+    page_data = await paging_data(db, user_select, structs.GetUserPageDetails)
+    return await response_base.fast_success(data=page_data)
 
 
 @router.put("/{pk}/super", summary="사용자 슈퍼 권한 변경", dependencies=[DependsRBAC])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터베이스 연결 풀 부하 테스트
+
+풀 크기 + 오버플로보다 많은 코루틴이 각각 연결을 잡고 SELECT SLEEP 을 실행하여 풀을 포화시키고,
+처리량과 체크아웃 대기 시간 히스토그램, 게이지, 타임아웃 수를 출력합니다.
+풀 설정은 DB_POOL_* 환경 변수(.env)로 변경합니다. 데이터베이스가 실행 중이어야 합니다.
+
+E.g. ::
+
+    cd backend/app
+    python benchmarks/db_pool.py
+    python benchmarks/db_pool.py --concurrency 100 --requests 2000 --hold 0.02
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+sys.path.append('../../')
+
+from sqlalchemy import text  # noqa: E402
+
+from backend.app.core.conf import settings  # noqa: E402
+from backend.app.database.db_mysql import SQLALCHEMY_DATABASE_URL, create_engine_and_session  # noqa: E402
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='연결 풀 부하 테스트')
+    parser.add_argument('--concurrency', type=int, default=100, help='동시 실행 코루틴 수')
+    parser.add_argument('--requests', type=int, default=2000, help='총 요청 수')
+    parser.add_argument('--hold', type=float, default=0.01, help='요청당 연결 점유 시간 (SELECT SLEEP)，단위：초')
+    args = parser.parse_args()
+
+    engine, db_session = create_engine_and_session(SQLALCHEMY_DATABASE_URL)
+    errors = 0
+
+    async def worker(count: int) -> None:
+        nonlocal errors
+        for _ in range(count):
+            try:
+                async with db_session() as db:
+                    await db.execute(text('SELECT SLEEP(:hold)'), {'hold': args.hold})
+            except Exception:
+                errors += 1
+
+    per_worker = args.requests // args.concurrency
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(per_worker) for _ in range(args.concurrency)])
+    elapsed = time.perf_counter() - start
+    status = engine.pool.status_snapshot()
+    await engine.dispose()
+
+    total = per_worker * args.concurrency
+    capacity = settings.DB_POOL_SIZE + settings.DB_POOL_MAX_OVERFLOW
+    print(f'pool size={settings.DB_POOL_SIZE} max_overflow={settings.DB_POOL_MAX_OVERFLOW} '
+          f'pre_ping={settings.DB_POOL_PRE_PING} concurrency={args.concurrency}')
+    print(f'requests={total} errors={errors} elapsed={elapsed:.2f}s throughput={total / elapsed:.0f}/s '
+          f'(ideal {capacity / args.hold:.0f}/s)')
+    wait = status['checkout_wait']
+    print(f'checkout wait: count={wait["count"]} avg={wait["sum_ms"] / max(wait["count"], 1):.2f}ms '
+          f'max={wait["max_ms"]:.2f}ms timeouts={status["timeouts"]} connects={status["connects"]}')
+    previous = 0
+    for bucket in wait['histogram']:
+        print(f'  <= {bucket["le"]:>6} ms: {bucket["count"] - previous}')
+        previous = bucket['count']
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
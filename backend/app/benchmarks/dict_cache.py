@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+사전 캐시 조회 처리량 벤치마크
+
+프로세스 내 스냅샷 적중, 매 조회마다 redis 버전 대조, 매 조회마다 무효화 후 다시 로드하는 경우를 측정합니다.
+redis 와 데이터베이스가 실행 중이어야 하며, 대상 사전 유형이 존재해야 합니다.
+
+E.g. ::
+
+    cd backend/app
+    python benchmarks/dict_cache.py --code sys_status
+    python benchmarks/dict_cache.py --code sys_status --number 50000 --concurrency 100
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+sys.path.append('../../')
+
+from backend.app.common.dict_cache import DictCache  # noqa: E402
+from backend.app.common.redis import redis_client  # noqa: E402
+
+TARGET = 10000
+
+
+async def bench(cache: DictCache, code: str, number: int, concurrency: int, invalidate: bool = False) -> float:
+    """
+    조회 처리량 측정
+
+    :param cache:
+    :param code: 사전 유형 코드
+    :param number: 총 조회 수
+    :param concurrency: 동시 실행 코루틴 수
+    :param invalidate: 매 조회 전 무효화 여부
+    :return: 초당 조회 수
+    """
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            if invalidate:
+                await cache.invalidate(code)
+            if await cache.get(code) is None:
+                raise SystemExit(f'사전 유형 {code} 이(가) 존재하지 않습니다')
+
+    await cache.get(code)
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(number // concurrency) for _ in range(concurrency)])
+    return number // concurrency * concurrency / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='사전 캐시 벤치마크')
+    parser.add_argument('--code', required=True, help='사전 유형 코드')
+    parser.add_argument('--number', type=int, default=20000, help='경우별 총 조회 수')
+    parser.add_argument('--concurrency', type=int, default=50, help='동시 실행 코루틴 수')
+    args = parser.parse_args()
+
+    await redis_client.open()
+    cases = [
+        ('local snapshot hit', DictCache(), False, args.number),
+        ('redis version check per lookup', DictCache(local_ttl=0), False, args.number),
+        ('reload from db per lookup', DictCache(local_ttl=0), True, max(args.number // 100, args.concurrency)),
+    ]
+    print(f'{"case":<36}{"lookups/s":>14}{"target":>10}')
+    for name, cache, invalidate, number in cases:
+        rate = await bench(cache, args.code, number, args.concurrency, invalidate)
+        print(f'{name:<36}{rate:>14.0f}{"ok" if rate >= TARGET else "-":>10}')
+    await redis_client.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비밀번호 해시 알고리즘별 로그인 CPU 비용 벤치마크
+
+로그인 1회는 검증 1회의 비용이 들며, 해시 정책이 변경된 경우 백그라운드 재해시 1회가 추가됩니다.
+
+E.g. ::
+
+    cd backend/app
+    python benchmarks/password_hash.py
+    python benchmarks/password_hash.py --bcrypt-rounds 10 12 14 --number 5
+"""
+import argparse
+import sys
+import time
+
+sys.path.append('../../')
+
+from passlib.context import CryptContext  # noqa: E402
+
+from backend.app.common.jwt import pwd_context  # noqa: E402
+from backend.app.core.conf import settings  # noqa: E402
+
+
+def bench(context: CryptContext, number: int) -> tuple[float, float]:
+    """
+    해시 생성 및 검증 평균 시간 측정
+
+    :param context:
+    :param number: 반복 횟수
+    :return: (hash ms, verify ms)
+    """
+    password = 'benchmark-password' + 'salt0'
+    start = time.perf_counter()
+    for _ in range(number):
+        hashed = context.hash(password)
+    hash_ms = (time.perf_counter() - start) / number * 1000
+    start = time.perf_counter()
+    for _ in range(number):
+        context.verify(password, hashed)
+    verify_ms = (time.perf_counter() - start) / number * 1000
+    return hash_ms, verify_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='비밀번호 해시 벤치마크')
+    parser.add_argument('--number', type=int, default=3, help='알고리즘별 반복 횟수')
+    parser.add_argument('--bcrypt-rounds', type=int, nargs='*', default=[10, 11, 12, 13])
+    parser.add_argument('--argon2-time-cost', type=int, nargs='*', default=[2, 3])
+    parser.add_argument('--argon2-memory-cost', type=int, default=settings.PASSWORD_ARGON2_MEMORY_COST)
+    parser.add_argument('--argon2-parallelism', type=int, default=settings.PASSWORD_ARGON2_PARALLELISM)
+    args = parser.parse_args()
+
+    cases = [(f'current policy {settings.PASSWORD_HASH_SCHEMES[0]}', pwd_context)]
+    for rounds in args.bcrypt_rounds:
+        cases.append((f'bcrypt rounds={rounds}', CryptContext(schemes=['bcrypt'], bcrypt__default_rounds=rounds)))
+    for time_cost in args.argon2_time_cost:
+        context = CryptContext(
+            schemes=['argon2'],
+            argon2__time_cost=time_cost,
+            argon2__memory_cost=args.argon2_memory_cost,
+            argon2__parallelism=args.argon2_parallelism,
+        )
+        cases.append((f'argon2 t={time_cost} m={args.argon2_memory_cost} p={args.argon2_parallelism}', context))
+
+    print(f'{"algorithm":<40}{"hash (ms)":>12}{"verify (ms)":>14}{"logins/s/core":>16}')
+    for name, context in cases:
+        try:
+            hash_ms, verify_ms = bench(context, args.number)
+        except Exception as e:
+            print(f'{name:<40}  skipped: {e}')
+            continue
+        print(f'{name:<40}{hash_ms:>12.1f}{verify_ms:>14.1f}{1000 / verify_ms:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
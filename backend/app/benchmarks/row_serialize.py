@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+select_list_serialize 벤치마크
+
+행마다 sync_to_async 로 스레드 풀을 거치던 기존 구현과, 모델별로 미리 컴파일한 직렬화기를 비교합니다.
+데이터베이스는 필요하지 않습니다.
+
+E.g. ::
+
+    cd backend/app
+    python benchmarks/row_serialize.py
+    python benchmarks/row_serialize.py --rows 100 1000 10000 --number 5
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from decimal import Decimal
+
+sys.path.append('../../')
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from sqlalchemy.orm import configure_mappers  # noqa: E402
+
+from backend.app.benchmarks.serialization import build_menus  # noqa: E402
+from backend.app.core.conf import settings  # noqa: E402
+from backend.app.utils.serializers import columns_serialize, select_list_serialize  # noqa: E402
+
+
+@sync_to_async
+def legacy_select_columns_serialize(row) -> dict:
+    obj_dict = {}
+    for column in row.__table__.columns.keys():
+        val = getattr(row, column)
+        if isinstance(val, Decimal):
+            if val % 1 == 0:
+                val = int(val)
+            val = float(val)
+        obj_dict[column] = val
+    return obj_dict
+
+
+async def legacy_select_list_serialize(row) -> list:
+    return [await legacy_select_columns_serialize(_) for _ in row]
+
+
+async def compiled_inline(row) -> list:
+    return columns_serialize(row)
+
+
+async def bench(func, rows, number: int) -> float:
+    await func(rows)
+    start = time.perf_counter()
+    for _ in range(number):
+        await func(rows)
+    return (time.perf_counter() - start) / number * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='행 직렬화 벤치마크')
+    parser.add_argument('--rows', type=int, nargs='*', default=[20, 1000, 10000], help='행 수')
+    parser.add_argument('--number', type=int, default=3, help='경우별 반복 횟수')
+    args = parser.parse_args()
+    configure_mappers()
+
+    print(f'offload threshold: {settings.SERIALIZE_OFFLOAD_THRESHOLD} rows')
+    print(f'{"rows":>8}{"legacy (ms)":>14}{"inline (ms)":>14}{"current (ms)":>14}{"speedup":>10}')
+    for count in args.rows:
+        rows = build_menus(count)
+        assert await legacy_select_list_serialize(rows[:10]) == await select_list_serialize(rows[:10])
+        legacy_ms = await bench(legacy_select_list_serialize, rows, args.number)
+        inline_ms = await bench(compiled_inline, rows, args.number)
+        current_ms = await bench(select_list_serialize, rows, args.number)
+        print(f'{count:>8}{legacy_ms:>14.2f}{inline_ms:>14.2f}{current_ms:>14.2f}{legacy_ms / current_ms:>9.1f}x')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답 직렬화 벤치마크
+
+사용자 목록(부서, 역할, 역할 메뉴 포함)과 메뉴 트리 인터페이스에서
+SQLAlchemy 객체 / 트리 데이터를 응답 본문 바이트로 만드는 시간을 측정합니다.
+
+- pydantic: ResponseModel + pydantic 스키마 검증 + FastAPI serialize_response + msgspec 인코딩 (기존 경로)
+- msgspec: schemas.structs 변환 + response_base.fast_success 한 번 인코딩
+
+데이터베이스는 필요하지 않습니다.
+
+E.g. ::
+
+    cd backend/app
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --rows 20 100 --menus 200 --number 200
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from datetime import timedelta
+
+sys.path.append('../../')
+
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from sqlalchemy.orm import configure_mappers  # noqa: E402
+
+from backend.app.common.pagination import _Page, _PageData  # noqa: E402
+from backend.app.common.response.response_schema import ResponseModel, response_base  # noqa: E402
+from backend.app.models import Dept, Menu, Role, User  # noqa: E402
+from backend.app.schemas import structs  # noqa: E402
+from backend.app.schemas.user import GetUserInfoListDetails  # noqa: E402
+from backend.app.utils.build_tree import get_tree_data  # noqa: E402
+from backend.app.utils.serializers import MsgSpecJSONResponse, struct_convert  # noqa: E402
+from backend.app.utils.timezone import timezone  # noqa: E402
+
+response_field = create_response_field(name='benchmark', type_=ResponseModel)
+
+
+def build(model, pk: int, **kwargs):
+    """SQLAlchemy 인스턴스 생성, 데이터베이스에서 로드한 것처럼 모든 컬럼 값을 채움"""
+    obj = model.__mapper__.class_manager.new_instance()
+    now = timezone.now()
+    for column in model.__table__.columns:
+        python_type = column.type.python_type
+        if python_type is int:
+            # 상태, 유형 등의 열거형 필드는 1 (유효한 값)
+            value = pk if column.name == 'id' or column.name.endswith('_id') else 1
+        elif python_type is bool:
+            value = True
+        elif python_type is str:
+            value = f'{column.name}_{pk}'
+        else:
+            value = now - timedelta(minutes=pk)
+        setattr(obj, column.name, value)
+    for key, value in kwargs.items():
+        setattr(obj, key, value)
+    return obj
+
+
+def build_users(rows: int) -> list[User]:
+    menus = [build(Menu, i, parent_id=None) for i in range(1, 11)]
+    roles = [build(Role, i, menus=menus) for i in range(1, 3)]
+    dept = build(Dept, 1, parent_id=None, phone=None, email='dept@example.com')
+    return [
+        build(User, i, dept=dept, roles=roles, email=f'user{i}@example.com', phone=None) for i in range(1, rows + 1)
+    ]
+
+
+def build_menus(count: int) -> list[Menu]:
+    return [build(Menu, i, parent_id=None if i <= 10 else (i - 1) // 10) for i in range(1, count + 1)]
+
+
+async def pydantic_user_list(users: list[User]) -> bytes:
+    page = _Page(items=users, total=len(users), page=1, size=len(users), total_pages=1, links={})
+    page_data = _PageData[_Page[GetUserInfoListDetails]](page_data=page).model_dump()['page_data']
+    res = await response_base.success(data=page_data)
+    content = await serialize_response(field=response_field, response_content=res, is_coroutine=True)
+    return MsgSpecJSONResponse(content).body
+
+
+async def msgspec_user_list(users: list[User]) -> bytes:
+    items = struct_convert(users, list[structs.GetUserInfoListDetails])
+    page_data = {'items': items, 'total': len(users), 'page': 1, 'size': len(users), 'total_pages': 1, 'links': {}}
+    return (await response_base.fast_success(data=page_data)).body
+
+
+async def pydantic_menu_tree(tree: list[dict]) -> bytes:
+    res = await response_base.success(data=tree)
+    content = await serialize_response(field=response_field, response_content=res, is_coroutine=True)
+    return MsgSpecJSONResponse(content).body
+
+
+async def msgspec_menu_tree(tree: list[dict]) -> bytes:
+    data = struct_convert(tree, list[structs.GetMenuTreeDetails])
+    return (await response_base.fast_success(data=data)).body
+
+
+async def bench(func, data, number: int) -> tuple[float, int]:
+    body = await func(data)
+    start = time.perf_counter()
+    for _ in range(number):
+        await func(data)
+    return (time.perf_counter() - start) / number * 1000, len(body)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='응답 직렬화 벤치마크')
+    parser.add_argument('--rows', type=int, nargs='*', default=[20, 100], help='사용자 목록 페이지 크기')
+    parser.add_argument('--menus', type=int, default=200, help='메뉴 트리 노드 수')
+    parser.add_argument('--number', type=int, default=100, help='경우별 반복 횟수')
+    args = parser.parse_args()
+    configure_mappers()
+
+    cases = []
+    for rows in args.rows:
+        users = build_users(rows)
+        cases.append((f'user list rows={rows}', users, pydantic_user_list, msgspec_user_list))
+    tree = await get_tree_data(build_menus(args.menus))
+    cases.append((f'menu tree nodes={args.menus}', tree, pydantic_menu_tree, msgspec_menu_tree))
+
+    print(f'{"endpoint":<28}{"pydantic (ms)":>16}{"msgspec (ms)":>16}{"speedup":>10}{"bytes":>10}')
+    for name, data, old, new in cases:
+        old_ms, _ = await bench(old, data, args.number)
+        new_ms, size = await bench(new, data, args.number)
+        print(f'{name:<28}{old_ms:>16.3f}{new_ms:>16.3f}{old_ms / new_ms:>9.1f}x{size:>10}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import asyncio
+
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import insert
+
+from backend.app.common.log import log
+from backend.app.core.conf import settings
+from backend.app.database.db_mysql import async_db_session
+from backend.app.models import LoginLog
+from backend.app.models.base import MappedBase
+from backend.app.utils.timezone import timezone
+
+
+class BatchWriter:
+    """
+    백그라운드 일괄 기록기
+
+    요청 처리 중에는 큐에 넣기만 하고, 백그라운드 작업이 레코드를 모아 executemany 로 한 번에 INSERT 합니다.
+    """
+
+    def __init__(
+        self,
+        model: type[MappedBase],
+        *,
+        batch_size: int = settings.LOG_WRITER_BATCH_SIZE,
+        flush_interval: float = settings.LOG_WRITER_FLUSH_INTERVAL,
+        max_size: int = settings.LOG_WRITER_QUEUE_MAXSIZE,
+    ):
+        self.model = model
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_size)
+        self._task: asyncio.Task | None = None
+        # 데이터 클래스 default_factory 는 Core INSERT 에 적용되지 않으므로 직접 채움
+        self._has_created_time = "created_time" in model.__table__.columns
+
+    @property
+    def qsize(self) -> int:
+        """대기 중인 레코드 수"""
+        return self._queue.qsize()
+
+    def put(self, obj_in: BaseModel | dict[str, Any]) -> None:
+        """
+        레코드를 큐에 추가, 블로킹하지 않음
+
+        :param obj_in: Pydantic 모델 클래스 또는 해당 데이터베이스 필드의 딕셔너리
+        :return:
+        """
+        data = obj_in.model_dump() if isinstance(obj_in, BaseModel) else dict(obj_in)
+        if self._has_created_time:
+            data.setdefault("created_time", timezone.now())
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            log.warning(f"{self.model.__tablename__} 기록 큐가 가득 차 레코드를 버립니다")
+
+    async def start(self) -> None:
+        """백그라운드 기록 작업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 기록 작업을 중지하고 남은 레코드를 모두 기록"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        큐에 남은 레코드를 즉시 기록
+
+        :return: 기록한 레코드 수
+        """
+        count = 0
+        while not self._queue.empty():
+            rows = []
+            while len(rows) < self.batch_size and not self._queue.empty():
+                rows.append(self._queue.get_nowait())
+            await self._write(rows)
+            count += len(rows)
+        return count
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            async with async_db_session.begin() as db:
+                await db.execute(insert(self.model), rows)
+        except Exception as e:
+            log.exception(f"{self.model.__tablename__} 일괄 기록 실패 ({len(rows)}건): {e}")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._write(rows)
+
+
+login_log_writer = BatchWriter(LoginLog)
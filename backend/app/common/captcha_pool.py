@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import asyncio
+
+from concurrent.futures import ProcessPoolExecutor
+
+from fast_captcha import img_captcha
+from starlette.concurrency import run_in_threadpool
+
+from backend.app.common.log import log
+from backend.app.common.redis import redis_client
+from backend.app.core.conf import settings
+
+# 풀 항목 형식: "{code}|{base64 image}", base64 문자에는 '|' 가 없음
+_SEPARATOR = "|"
+
+_LUA_POP_CAPTCHA = """
+local item = redis.call('LPOP', KEYS[1])
+if not item then
+    return false
+end
+local sep = string.find(item, '|', 1, true)
+redis.call('SET', KEYS[2], string.sub(item, 1, sep - 1), 'EX', ARGV[1])
+return string.sub(item, sep + 1)
+"""
+
+_pop_captcha_script = redis_client.register_script(_LUA_POP_CAPTCHA)
+
+
+def render_captcha(count: int) -> list[str]:
+    """
+    인증 코드 이미지 일괄 생성, 프로세스 풀에서 실행됨
+
+    :param count: 생성 수
+    :return:
+    """
+    items = []
+    for _ in range(count):
+        img, code = img_captcha(img_byte="base64")
+        items.append(f"{code}{_SEPARATOR}{img}")
+    return items
+
+
+class CaptchaPool:
+    """
+    인증 코드 사전 생성 풀
+
+    백그라운드 작업이 프로세스 풀에서 렌더링한 (코드, 이미지) 쌍으로 redis 리스트를 채우고,
+    요청 시에는 한 번의 왕복으로 꺼내어 코드를 클라이언트 IP 에 바인딩합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = settings.CAPTCHA_POOL_SIZE,
+        workers: int = settings.CAPTCHA_POOL_WORKERS,
+        refill_batch: int = settings.CAPTCHA_POOL_REFILL_BATCH,
+        refill_interval: float = settings.CAPTCHA_POOL_REFILL_INTERVAL,
+    ):
+        self.key = f"{settings.CAPTCHA_POOL_REDIS_PREFIX}:pool"
+        self.size = size
+        self.workers = workers
+        self.refill_batch = refill_batch
+        self.refill_interval = refill_interval
+        self._executor: ProcessPoolExecutor | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """백그라운드 보충 작업 시작"""
+        if self._task is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 보충 작업 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def pop(self, ip: str) -> str:
+        """
+        사전 생성된 인증 코드를 꺼내 클라이언트 IP 에 바인딩, 풀이 비어 있으면 즉시 생성
+
+        :param ip: 클라이언트 IP
+        :return: base64 이미지
+        """
+        captcha_key = f"{settings.CAPTCHA_LOGIN_REDIS_PREFIX}:{ip}"
+        img = await _pop_captcha_script(
+            keys=[self.key, captcha_key],
+            args=[settings.CAPTCHA_LOGIN_EXPIRE_SECONDS],
+        )
+        if img is not None:
+            return img
+        img, code = await run_in_threadpool(img_captcha, img_byte="base64")
+        await redis_client.set(captcha_key, code, ex=settings.CAPTCHA_LOGIN_EXPIRE_SECONDS)
+        return img
+
+    async def refill(self) -> int:
+        """
+        풀이 가득 찰 때까지 일괄 생성하여 보충
+
+        :return: 보충한 수
+        """
+        loop = asyncio.get_running_loop()
+        missing = self.size - await redis_client.llen(self.key)
+        if missing <= 0:
+            return 0
+        batches = [self.refill_batch] * (missing // self.refill_batch)
+        if missing % self.refill_batch:
+            batches.append(missing % self.refill_batch)
+        count = 0
+        for items in asyncio.as_completed(
+            [loop.run_in_executor(self._executor, render_captcha, n) for n in batches]
+        ):
+            items = await items
+            # 여러 워커가 동시에 보충하더라도 풀 크기를 크게 넘지 않도록 잘라냄
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.rpush(self.key, *items)
+                pipe.ltrim(self.key, 0, self.size - 1)
+                await pipe.execute()
+            count += len(items)
+        return count
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refill()
+            except Exception as e:
+                log.error(f"인증 코드 풀 보충 실패: {e}")
+            await asyncio.sleep(self.refill_interval)
+
+
+captcha_pool = CaptchaPool()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import hashlib
+import time
+
+from fastapi import Request, Response
+
+from backend.app.common.exception.errors import NotModifiedError
+from backend.app.common.redis import redis_client
+from backend.app.core.conf import settings
+
+# 버전이 없는 리소스는 현재 시각으로 초기화하여, redis 가 비워진 후에도 이전 ETag 와 겹치지 않도록 함
+_LUA_GET_VERSIONS = """
+local versions = {}
+for i, key in ipairs(KEYS) do
+    local version = redis.call('GET', key)
+    if not version then
+        version = ARGV[1]
+        redis.call('SET', key, version)
+    end
+    versions[i] = version
+end
+return versions
+"""
+
+_get_versions_script = redis_client.register_script(_LUA_GET_VERSIONS)
+
+
+class ResourceVersion:
+    """
+    리소스 버전
+
+    리소스마다 redis 카운터를 두고, 관련 서비스의 쓰기 작업이 트랜잭션 커밋 후 카운터를 올립니다.
+    """
+
+    def __init__(self):
+        self.prefix = settings.RESOURCE_VERSION_REDIS_PREFIX
+
+    async def get(self, *resources: str) -> list[str]:
+        """
+        리소스 버전 일괄 가져오기, 한 번의 왕복
+
+        :param resources: 리소스 이름
+        :return:
+        """
+        return await _get_versions_script(keys=[f'{self.prefix}:{r}' for r in resources], args=[time.time_ns()])
+
+    async def bump(self, *resources: str) -> None:
+        """
+        리소스 버전 올리기, 트랜잭션 커밋 후 호출해야 함
+
+        :param resources: 리소스 이름
+        :return:
+        """
+        if not resources:
+            return
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for resource in resources:
+                pipe.incr(f'{self.prefix}:{resource}')
+            await pipe.execute()
+
+
+resource_version = ResourceVersion()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 요청 헤더가 ETag 와 일치하는지 확인
+
+    :param if_none_match:
+    :param etag:
+    :return:
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return etag.removeprefix('W/') in (tag.strip().removeprefix('W/') for tag in if_none_match.split(','))
+
+
+class ConditionalGet:
+    """
+    조건부 GET 의존성
+
+    리소스 버전으로 ETag 를 계산하여 응답 헤더에 설정하고, If-None-Match 가 일치하면
+    데이터베이스 조회와 직렬화 전에 304 를 반환합니다. 인터페이스 코드는 변경할 필요가 없습니다.
+
+    E.g. ::
+
+        @router.get('/all', dependencies=[DependsJwtAuth, Depends(ConditionalGet('role'))])
+    """
+
+    def __init__(self, *resources: str, per_user: bool = False):
+        """
+        :param resources: 응답 내용이 의존하는 리소스 이름
+        :param per_user: 응답이 사용자별로 다른 경우 True, 사용자 리소스 user:{id} 버전도 포함
+        """
+        self.resources = resources
+        self.per_user = per_user
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        resources = list(self.resources)
+        if self.per_user:
+            resources.append(f'user:{request.user.id}')
+        versions = await resource_version.get(*resources)
+        tag = ','.join(f'{r}={v}' for r, v in zip(resources, versions))
+        key = f'{request.url.path}?{request.url.query}|{tag}'
+        etag = f'W/"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache' if self.per_user else 'no-cache'}
+        if etag_matches(request.headers.get('if-none-match'), etag):
+            raise NotModifiedError(headers=headers)
+        response.headers.update(headers)
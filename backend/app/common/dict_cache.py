@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import dataclasses
+import hashlib
+import time
+
+import msgspec
+
+from backend.app.common.redis import redis_client
+from backend.app.common.response.response_code import CustomResponseCode
+from backend.app.core.conf import settings
+from backend.app.crud.crud_dict_data import dict_data_dao
+from backend.app.crud.crud_dict_type import dict_type_dao
+from backend.app.database.db_mysql import async_db_session
+
+
+@dataclasses.dataclass
+class DictSnapshot:
+    """사전 유형 하나의 전체 스냅샷, content 는 미리 인코딩된 응답 본문"""
+
+    version: str
+    etag: str
+    content: bytes
+    checked_at: float = 0.0
+
+
+class DictCache:
+    """
+    사전 캐시
+
+    사전 유형 코드별 전체 스냅샷을 미리 인코딩된 msgspec 바이트로 redis 와 프로세스 내에 보관합니다.
+    각 스냅샷은 redis 버전 번호로 식별되며, 쓰기 작업은 커밋 후 버전을 올려 모든 워커의 스냅샷을 무효화합니다.
+    프로세스 내 스냅샷은 DICT_CACHE_LOCAL_TTL 초마다 redis 버전과 대조합니다.
+    """
+
+    def __init__(self, *, local_ttl: float = settings.DICT_CACHE_LOCAL_TTL):
+        self.prefix = settings.DICT_CACHE_REDIS_PREFIX
+        self.local_ttl = local_ttl
+        self._local: dict[str, DictSnapshot] = {}
+
+    def _version_key(self, code: str) -> str:
+        return f'{self.prefix}:version:{code}'
+
+    def _data_key(self, code: str) -> str:
+        return f'{self.prefix}:data:{code}'
+
+    async def get(self, code: str) -> DictSnapshot | None:
+        """
+        사전 유형 코드로 스냅샷 가져오기
+
+        :param code: 사전 유형 코드
+        :return: 사전 유형이 존재하지 않으면 None
+        """
+        now = time.monotonic()
+        snapshot = self._local.get(code)
+        if snapshot is not None:
+            if now - snapshot.checked_at < self.local_ttl:
+                return snapshot
+            version = await redis_client.get(self._version_key(code)) or '0'
+            if version == snapshot.version:
+                snapshot.checked_at = now
+                return snapshot
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(self._version_key(code))
+            pipe.hgetall(self._data_key(code))
+            version, cached = await pipe.execute()
+        version = version or '0'
+        if cached and cached['version'] == version:
+            content = cached['content'].encode()
+        else:
+            # 조회 전에 읽은 버전으로 저장하므로, 조회 중 쓰기가 발생해도 다음 요청에서 다시 로드됨
+            content = await self._load(code)
+            if content is None:
+                self._local.pop(code, None)
+                return None
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(self._data_key(code), mapping={'version': version, 'content': content.decode()})
+                pipe.expire(self._data_key(code), settings.DICT_CACHE_EXPIRE_SECONDS)
+                await pipe.execute()
+        snapshot = DictSnapshot(
+            version=version,
+            etag=f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"',
+            content=content,
+            checked_at=now,
+        )
+        self._local[code] = snapshot
+        return snapshot
+
+    async def invalidate(self, *codes: str) -> None:
+        """
+        사전 유형 코드의 버전을 올려 스냅샷 무효화, 트랜잭션 커밋 후 호출해야 함
+
+        :param codes: 사전 유형 코드
+        :return:
+        """
+        if not codes:
+            return
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for code in codes:
+                pipe.incr(self._version_key(code))
+                pipe.delete(self._data_key(code))
+                self._local.pop(code, None)
+            await pipe.execute()
+
+    @staticmethod
+    async def _load(code: str) -> bytes | None:
+        async with async_db_session() as db:
+            dict_type = await dict_type_dao.get_by_code(db, code)
+            if not dict_type:
+                return None
+            dict_datas = await dict_data_dao.get_all_by_type_id(db, dict_type.id)
+        data = {
+            'id': dict_type.id,
+            'name': dict_type.name,
+            'code': dict_type.code,
+            'status': dict_type.status,
+            'remark': dict_type.remark,
+            'datas': [
+                {
+                    'id': dict_data.id,
+                    'label': dict_data.label,
+                    'value': dict_data.value,
+                    'sort': dict_data.sort,
+                    'status': dict_data.status,
+                    'remark': dict_data.remark,
+                }
+                for dict_data in dict_datas
+            ],
+        }
+        res = CustomResponseCode.HTTP_200
+        return msgspec.json.encode({'code': res.code, 'msg': res.msg, 'data': data})
+
+
+dict_cache = DictCache()
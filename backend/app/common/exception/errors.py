@@ -139,3 +139,10 @@ class TokenError(HTTPError):
         super().__init__(
             code=self.code, msg=msg, headers=headers or {"WWW-Authenticate": "Bearer"}
         )
+
+
+class NotModifiedError(HTTPError):
+    code = StandardResponseCode.HTTP_304
+
+    def __init__(self, *, headers: dict[str, Any] | None = None):
+        super().__init__(code=self.code, headers=headers)
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from pydantic.errors import PydanticUserError
@@ -79,6 +79,8 @@ def register_exception(app: FastAPI):
         :param exc:
         :return:
         """
+        if exc.status_code == StandardResponseCode.HTTP_304:
+            return Response(status_code=exc.status_code, headers=exc.headers)
         if settings.ENVIRONMENT == "dev":
             content = {
                 "code": exc.status_code,
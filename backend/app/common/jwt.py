@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 from asgiref.sync import sync_to_async
 from fastapi import Depends, Request
@@ -10,14 +11,47 @@ from jose import jwt
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.common.exception.errors import AuthorizationError, TokenError
+from backend.app.common.exception.errors import (
+    AuthorizationError,
+    CustomError,
+    TokenError,
+)
 from backend.app.common.redis import redis_client
+from backend.app.common.response.response_code import CustomErrorCode
+from backend.app.common.token_revocation import token_revocation
 from backend.app.core.conf import settings
 from backend.app.crud.crud_user import user_dao
 from backend.app.models import User
 from backend.app.utils.timezone import timezone
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def create_pwd_context() -> CryptContext:
+    """
+    설정된 해시 정책으로 비밀번호 컨텍스트 생성
+
+    정책과 다른 알고리즘 또는 비용으로 생성된 해시는 needs_update 에서 True 를 반환하며, 로그인 성공 시 재해시됩니다.
+
+    :return:
+    """
+    schemes = settings.PASSWORD_HASH_SCHEMES
+    options = {}
+    if "bcrypt" in schemes:
+        rounds = settings.PASSWORD_BCRYPT_ROUNDS
+        options.update(
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+        )
+    if "argon2" in schemes:
+        options.update(
+            argon2__time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+            argon2__memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+            argon2__parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+pwd_context = create_pwd_context()
 
 # Deprecated, may be enabled when oauth2 is actually integrated
 oauth2_schema = OAuth2PasswordBearer(tokenUrl=settings.TOKEN_URL_SWAGGER)
@@ -49,25 +83,102 @@ def password_verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-async def create_access_token(
+def password_needs_update(hashed_password: str) -> bool:
+    """
+    비밀번호 해시가 현재 해시 정책과 일치하지 않는지 확인
+
+    :param hashed_password: 확인할 해시 암호
+    :return:
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
+def encode_access_token(
     sub: str, expires_delta: timedelta | None = None, **kwargs
-) -> tuple[str, datetime]:
+) -> tuple[str, datetime, int]:
     """
-    Generate encryption token
+    Encode access token, without storing it in redis
 
     :param sub: The subject/userid of the JWT
     :param expires_delta: Increased expiry time
-    :return:
+    :return: token, expiry time, redis expiry seconds
     """
+    current_datetime = timezone.now()
     if expires_delta:
-        expire = timezone.now() + expires_delta
         expire_seconds = int(expires_delta.total_seconds())
+    elif settings.TOKEN_STATELESS:
+        expire_seconds = settings.TOKEN_STATELESS_EXPIRE_SECONDS
     else:
-        expire = timezone.now() + timedelta(seconds=settings.TOKEN_EXPIRE_SECONDS)
         expire_seconds = settings.TOKEN_EXPIRE_SECONDS
-    multi_login = kwargs.pop("multi_login", None)
-    to_encode = {"exp": expire, "sub": sub, **kwargs}
+    expire = current_datetime + timedelta(seconds=expire_seconds)
+    to_encode = {
+        "exp": expire,
+        "iat": int(current_datetime.timestamp()),
+        "sub": sub,
+        "jti": uuid4().hex,
+        **kwargs,
+    }
     token = jwt.encode(to_encode, settings.TOKEN_SECRET_KEY, settings.TOKEN_ALGORITHM)
+    return token, expire, expire_seconds
+
+
+def encode_refresh_token(
+    sub: str, expire_time: datetime | None = None, **kwargs
+) -> tuple[str, datetime, int]:
+    """
+    Encode refresh token, without storing it in redis
+
+    :param sub: The subject/userid of the JWT
+    :param expire_time: access token expiry time, the refresh token expires after it
+    :return: token, expiry time, redis expiry seconds
+    """
+    current_datetime = timezone.now()
+    if expire_time:
+        if timezone.f_datetime(expire_time) < current_datetime:
+            raise TokenError(msg="Refresh Token 유효기간이 잘못되었습니다.")
+        expire = expire_time + timedelta(seconds=settings.TOKEN_REFRESH_EXPIRE_SECONDS)
+    else:
+        expire = current_datetime + timedelta(
+            seconds=settings.TOKEN_REFRESH_EXPIRE_SECONDS
+        )
+    expire_seconds = int((timezone.f_datetime(expire) - current_datetime).total_seconds())
+    to_encode = {"exp": expire, "sub": sub, "jti": uuid4().hex, **kwargs}
+    refresh_token = jwt.encode(
+        to_encode, settings.TOKEN_SECRET_KEY, settings.TOKEN_ALGORITHM
+    )
+    return refresh_token, expire, expire_seconds
+
+
+def token_redis_key(prefix: str, sub: str, token: str) -> str:
+    """
+    토큰 redis 키, 무상태 모드에서는 전체 토큰 대신 jti 를 사용하여 키 크기를 줄임
+
+    :param prefix:
+    :param sub: The subject/userid of the JWT
+    :param token:
+    :return:
+    """
+    if settings.TOKEN_STATELESS:
+        token = jwt.get_unverified_claims(token).get("jti") or token
+    return f"{prefix}:{sub}:{token}"
+
+
+async def create_access_token(
+    sub: str, expires_delta: timedelta | None = None, **kwargs
+) -> tuple[str, datetime]:
+    """
+    Generate encryption token
+
+    :param sub: The subject/userid of the JWT
+    :param expires_delta: Increased expiry time
+    :return:
+    """
+    multi_login = kwargs.pop("multi_login", None)
+    token, expire, expire_seconds = encode_access_token(sub, expires_delta, **kwargs)
+    if settings.TOKEN_STATELESS:
+        if multi_login is False:
+            await token_revocation.revoke_user(int(sub), _token_iat(token))
+        return token, expire
     if multi_login is False:
         prefix = f"{settings.TOKEN_REDIS_PREFIX}:{sub}:"
         await redis_client.delete_prefix(prefix)
@@ -86,55 +197,167 @@ async def create_refresh_token(
     :param expire_time: expiry time
     :return:
     """
-    if expire_time:
-        expire = expire_time + timedelta(seconds=settings.TOKEN_REFRESH_EXPIRE_SECONDS)
-        expire_datetime = timezone.f_datetime(expire_time)
-        current_datetime = timezone.now()
-        if expire_datetime < current_datetime:
-            raise TokenError(msg="Refresh Token 유효기간이 잘못되었습니다.")
-        expire_seconds = int((expire_datetime - current_datetime).total_seconds())
-    else:
-        expire = timezone.now() + timedelta(seconds=settings.TOKEN_EXPIRE_SECONDS)
-        expire_seconds = settings.TOKEN_REFRESH_EXPIRE_SECONDS
     multi_login = kwargs.pop("multi_login", None)
-    to_encode = {"exp": expire, "sub": sub, **kwargs}
-    refresh_token = jwt.encode(
-        to_encode, settings.TOKEN_SECRET_KEY, settings.TOKEN_ALGORITHM
+    refresh_token, expire, expire_seconds = encode_refresh_token(
+        sub, expire_time, **kwargs
     )
     if multi_login is False:
         prefix = f"{settings.TOKEN_REFRESH_REDIS_PREFIX}:{sub}:"
         await redis_client.delete_prefix(prefix)
-    key = f"{settings.TOKEN_REFRESH_REDIS_PREFIX}:{sub}:{refresh_token}"
+    key = token_redis_key(settings.TOKEN_REFRESH_REDIS_PREFIX, sub, refresh_token)
     await redis_client.setex(key, expire_seconds, refresh_token)
     return refresh_token, expire
 
 
+# 지정된 접두사의 모든 키를 스크립트 내부에서 삭제하는 Lua 함수
+_LUA_DELETE_PREFIX = """
+local function delete_prefix(prefix)
+    local cursor = '0'
+    repeat
+        local result = redis.call('SCAN', cursor, 'MATCH', prefix .. '*', 'COUNT', 1000)
+        cursor = result[1]
+        for _, key in ipairs(result[2]) do
+            redis.call('DEL', key)
+        end
+    until cursor == '0'
+end
+"""
+
+# 로그인: 인증 코드 검증 및 삭제, 기존 토큰 무효화, 새 토큰 저장을 한 번의 왕복으로 처리
+# KEYS[1]: 인증 코드 키, KEYS[2]: 액세스 토큰 키, KEYS[3]: 리프레시 토큰 키
+# ARGV[1]: 소문자 인증 코드, ARGV[2~3]: 액세스 토큰 및 만료 초('0' 이면 저장하지 않음), ARGV[4~5]: 리프레시 토큰 및 만료 초
+# ARGV[6]: 다중 로그인 금지 여부('1'), ARGV[7~8]: 무효화할 액세스/리프레시 토큰 접두사
+_LUA_LOGIN_TOKEN = _LUA_DELETE_PREFIX + """
+local captcha = redis.call('GET', KEYS[1])
+if not captcha then
+    return -1
+end
+if string.lower(captcha) ~= ARGV[1] then
+    return -2
+end
+redis.call('DEL', KEYS[1])
+if ARGV[6] == '1' then
+    delete_prefix(ARGV[7])
+    delete_prefix(ARGV[8])
+end
+if ARGV[3] ~= '0' then
+    redis.call('SETEX', KEYS[2], ARGV[3], ARGV[2])
+end
+redis.call('SETEX', KEYS[3], ARGV[5], ARGV[4])
+return 1
+"""
+
+_login_token_script = redis_client.register_script(_LUA_LOGIN_TOKEN)
+
+
+async def create_login_token(
+    sub: str, *, captcha_key: str, captcha: str, multi_login: bool
+) -> tuple[str, datetime, str, datetime]:
+    """
+    로그인 토큰 생성, 인증 코드 검증부터 토큰 저장까지 단일 Lua 스크립트로 실행
+
+    :param sub: The subject/userid of the JWT
+    :param captcha_key: 인증 코드 redis 키
+    :param captcha: 사용자가 입력한 인증 코드
+    :param multi_login: 다중 로그인 허용 여부, 허용하지 않으면 기존 토큰을 모두 무효화
+    :return: access token, access token expiry time, refresh token, refresh token expiry time
+    """
+    access_token, access_expire, access_expire_seconds = encode_access_token(sub)
+    refresh_token, refresh_expire, refresh_expire_seconds = encode_refresh_token(
+        sub, access_expire
+    )
+    result = await _login_token_script(
+        keys=[
+            captcha_key,
+            f"{settings.TOKEN_REDIS_PREFIX}:{sub}:{access_token}",
+            token_redis_key(settings.TOKEN_REFRESH_REDIS_PREFIX, sub, refresh_token),
+        ],
+        args=[
+            captcha.lower(),
+            access_token,
+            0 if settings.TOKEN_STATELESS else access_expire_seconds,
+            refresh_token,
+            refresh_expire_seconds,
+            "0" if multi_login else "1",
+            f"{settings.TOKEN_REDIS_PREFIX}:{sub}:",
+            f"{settings.TOKEN_REFRESH_REDIS_PREFIX}:{sub}:",
+        ],
+    )
+    if result == -1:
+        raise AuthorizationError(msg="인증 코드가 만료되었습니다. 다시 가져오세요.")
+    if result == -2:
+        raise CustomError(error=CustomErrorCode.CAPTCHA_ERROR)
+    if settings.TOKEN_STATELESS and not multi_login:
+        await token_revocation.revoke_user(int(sub), _token_iat(access_token))
+    return access_token, access_expire, refresh_token, refresh_expire
+
+
+# 토큰 갱신: 리프레시 토큰 검증, 기존 토큰 폐기, 새 토큰 저장을 원자적으로 처리
+# KEYS[1]: 기존 리프레시 토큰 키, KEYS[2]: 기존 액세스 토큰 키, KEYS[3]: 새 액세스 토큰 키, KEYS[4]: 새 리프레시 토큰 키
+# ARGV[1]: 기존 리프레시 토큰, ARGV[2~3]: 새 액세스 토큰 및 만료 초('0' 이면 저장하지 않음), ARGV[4~5]: 새 리프레시 토큰 및 만료 초
+# ARGV[6]: 다중 로그인 금지 여부('1'), ARGV[7~8]: 무효화할 액세스/리프레시 토큰 접두사
+_LUA_NEW_TOKEN = _LUA_DELETE_PREFIX + """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+if ARGV[6] == '1' then
+    delete_prefix(ARGV[7])
+    delete_prefix(ARGV[8])
+end
+if ARGV[3] ~= '0' then
+    redis.call('SETEX', KEYS[3], ARGV[3], ARGV[2])
+end
+redis.call('SETEX', KEYS[4], ARGV[5], ARGV[4])
+return 1
+"""
+
+_new_token_script = redis_client.register_script(_LUA_NEW_TOKEN)
+
+
 async def create_new_token(
     sub: str, token: str, refresh_token: str, **kwargs
 ) -> tuple[str, str, datetime, datetime]:
     """
-    새 토큰 생성
+    새 토큰 생성, 동일한 리프레시 토큰으로 동시에 요청하면 하나만 성공
 
     :param sub:
     :param token
     :param refresh_token:
     :return:
     """
-    redis_refresh_token = await redis_client.get(
-        f"{settings.TOKEN_REFRESH_REDIS_PREFIX}:{sub}:{refresh_token}"
+    multi_login = kwargs.pop("multi_login", None)
+    new_access_token, new_access_token_expire_time, access_expire_seconds = (
+        encode_access_token(sub, **kwargs)
     )
-    if not redis_refresh_token or redis_refresh_token != refresh_token:
-        raise TokenError(msg="리프레시 토큰이 만료되었습니다.")
-    new_access_token, new_access_token_expire_time = await create_access_token(
-        sub, **kwargs
+    new_refresh_token, new_refresh_token_expire_time, refresh_expire_seconds = (
+        encode_refresh_token(sub, **kwargs)
     )
-    new_refresh_token, new_refresh_token_expire_time = await create_refresh_token(
-        sub, **kwargs
+    result = await _new_token_script(
+        keys=[
+            token_redis_key(settings.TOKEN_REFRESH_REDIS_PREFIX, sub, refresh_token),
+            f"{settings.TOKEN_REDIS_PREFIX}:{sub}:{token}",
+            f"{settings.TOKEN_REDIS_PREFIX}:{sub}:{new_access_token}",
+            token_redis_key(settings.TOKEN_REFRESH_REDIS_PREFIX, sub, new_refresh_token),
+        ],
+        args=[
+            refresh_token,
+            new_access_token,
+            0 if settings.TOKEN_STATELESS else access_expire_seconds,
+            new_refresh_token,
+            refresh_expire_seconds,
+            "1" if multi_login is False else "0",
+            f"{settings.TOKEN_REDIS_PREFIX}:{sub}:",
+            f"{settings.TOKEN_REFRESH_REDIS_PREFIX}:{sub}:",
+        ],
     )
-    token_key = f"{settings.TOKEN_REDIS_PREFIX}:{sub}:{token}"
-    refresh_token_key = f"{settings.TOKEN_REDIS_PREFIX}:{sub}:{refresh_token}"
-    await redis_client.delete(token_key)
-    await redis_client.delete(refresh_token_key)
+    if not result:
+        raise TokenError(msg="리프레시 토큰이 만료되었습니다.")
+    if settings.TOKEN_STATELESS:
+        if multi_login is False:
+            await token_revocation.revoke_user(int(sub), _token_iat(new_access_token))
+        else:
+            await revoke_token(token)
     return (
         new_access_token,
         new_refresh_token,
@@ -157,10 +380,14 @@ def get_token(request: Request) -> str:
     return token
 
 
-@sync_to_async
-def jwt_decode(token: str) -> int:
+def _token_iat(token: str) -> int:
+    """자체 발급한 토큰의 발급 시각 가져오기"""
+    return jwt.get_unverified_claims(token)["iat"]
+
+
+def jwt_decode_payload(token: str) -> dict:
     """
-    토큰 디코딩
+    토큰 디코딩, 페이로드 반환
 
     :param token:
     :return:
@@ -176,7 +403,31 @@ def jwt_decode(token: str) -> int:
         raise TokenError(msg="토큰이 만료되었습니다.")
     except (jwt.JWTError, Exception):
         raise TokenError(msg="유효하지 않은 토큰입니다.")
-    return user_id
+    payload["sub"] = user_id
+    return payload
+
+
+@sync_to_async
+def jwt_decode(token: str) -> int:
+    """
+    토큰 디코딩
+
+    :param token:
+    :return:
+    """
+    return jwt_decode_payload(token)["sub"]
+
+
+async def revoke_token(token: str) -> None:
+    """
+    무상태 모드에서 단일 액세스 토큰 폐기
+
+    :param token:
+    :return:
+    """
+    claims = jwt.get_unverified_claims(token)
+    if claims.get("jti"):
+        await token_revocation.revoke(claims["jti"], claims["exp"])
 
 
 async def jwt_authentication(token: str) -> dict[str, int]:
@@ -186,6 +437,15 @@ async def jwt_authentication(token: str) -> dict[str, int]:
     :param token:
     :return:
     """
+    if settings.TOKEN_STATELESS:
+        # 서명과 만료 시간 검증 후 프로세스 내 폐기 목록만 확인, 대부분 네트워크 I/O 없음
+        payload = jwt_decode_payload(token)
+        user_id = payload["sub"]
+        if await token_revocation.is_revoked(
+            user_id, payload.get("jti"), payload.get("iat", 0)
+        ):
+            raise TokenError(msg="토큰이 만료되었습니다.")
+        return {"sub": user_id}
     user_id = await jwt_decode(token)
     key = f"{settings.TOKEN_REDIS_PREFIX}:{user_id}:{token}"
     token_verify = await redis_client.get(key)
@@ -11,8 +11,11 @@ from fastapi_pagination import pagination_ctx
 from fastapi_pagination.bases import AbstractPage, AbstractParams, RawParams
 from fastapi_pagination.ext.sqlalchemy import paginate
 from fastapi_pagination.links.bases import create_links
+from msgspec import Struct
 from pydantic import BaseModel
 
+from backend.app.utils.serializers import struct_convert
+
 if TYPE_CHECKING:
     from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -96,9 +99,26 @@ async def paging_data(
 
     :param db:
     :param select:
-    :param page_data_schema:
+    :param page_data_schema: pydantic 모델 또는 msgspec Struct, Struct 인 경우 pydantic 검증 없이 바로 변환
     :return:
     """
+    if isinstance(page_data_schema, type) and issubclass(page_data_schema, Struct):
+        # 프로젝션 조회 행에는 JSON 배열 등 해시 불가능한 값이 있을 수 있으므로 unique 처리하지 않음,
+        # joinedload 컬렉션을 포함한 엔티티 조회에는 사용하지 말 것
+        _paginate = await paginate(
+            db,
+            select,
+            transformer=lambda items: struct_convert(items, list[page_data_schema]),
+            unique=False,
+        )
+        return {
+            "items": _paginate.items,
+            "total": _paginate.total,
+            "page": _paginate.page,
+            "size": _paginate.size,
+            "total_pages": _paginate.total_pages,
+            "links": _paginate.links,
+        }
     _paginate = await paginate(db, select)
     page_data = _PageData[_Page[page_data_schema]](page_data=_paginate).model_dump()[
         "page_data"
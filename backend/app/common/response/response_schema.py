@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict
 
 from backend.app.common.response.response_code import CustomResponse, CustomResponseCode
 from backend.app.core.conf import settings
+from backend.app.utils.serializers import MsgSpecJSONResponse
 
 _ExcludeData = set[int | str] | dict[int | str, Any]
 
@@ -83,5 +84,21 @@ class ResponseBase:
     ) -> ResponseModel:
         return await self.__response(res=res, data=data)
 
+    @staticmethod
+    async def fast_success(
+        *,
+        res: CustomResponseCode | CustomResponse = CustomResponseCode.HTTP_200,
+        data: Any | None = None,
+    ) -> MsgSpecJSONResponse:
+        """
+        此方法直接返回由 msgspec 一次编码的响应, 跳过 ResponseModel 校验和 jsonable_encoder,
+        data 应为 msgspec Struct (见 schemas.structs) 或可被 msgspec 直接编码的数据
+
+        :param res: 返回信息
+        :param data: 返回数据
+        :return:
+        """
+        return MsgSpecJSONResponse({'code': res.code, 'msg': res.msg, 'data': data})
+
 
 response_base = ResponseBase()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import asyncio
+import hashlib
+import math
+import time
+
+from backend.app.common.log import log
+from backend.app.common.redis import redis_client
+from backend.app.core.conf import settings
+
+
+class BloomFilter:
+    """
+    블룸 필터
+
+    포함되지 않은 항목은 항상 False 를 반환하고, 포함된 것으로 판정된 항목은 error_rate 확률로 오탐일 수 있습니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class TokenRevocation:
+    """
+    무상태 토큰 폐기 목록
+
+    폐기된 jti 는 redis sorted set(score: 만료 시각)에, 사용자별 토큰 유효 시작 시각은 redis hash 에 저장하고,
+    pub/sub 으로 각 워커의 프로세스 내 블룸 필터와 시각 테이블을 동기화합니다. 대부분의 검증은 네트워크 I/O 없이 끝납니다.
+    """
+
+    def __init__(self):
+        self.jti_key = f'{settings.TOKEN_REVOKE_REDIS_PREFIX}:jti'
+        self.user_key = f'{settings.TOKEN_REVOKE_REDIS_PREFIX}:user'
+        self.channel = f'{settings.TOKEN_REVOKE_REDIS_PREFIX}:channel'
+        self._bloom = self._new_bloom()
+        self._valid_after: dict[int, int] = {}
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _new_bloom() -> BloomFilter:
+        return BloomFilter(settings.TOKEN_REVOKE_BLOOM_CAPACITY, settings.TOKEN_REVOKE_BLOOM_ERROR_RATE)
+
+    async def open(self) -> None:
+        """폐기 목록을 불러오고 동기화 작업 시작"""
+        await self.load()
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def load(self) -> None:
+        """redis 에서 폐기 목록을 다시 불러와 블룸 필터를 재구성, 만료된 jti 는 정리"""
+        now = int(time.time())
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(self.jti_key, '-inf', now)
+            pipe.zrange(self.jti_key, 0, -1)
+            pipe.hgetall(self.user_key)
+            _, jtis, valid_after = await pipe.execute()
+        bloom = self._new_bloom()
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._valid_after = {int(k): int(v) for k, v in valid_after.items()}
+
+    async def revoke(self, jti: str, expire: int) -> None:
+        """
+        단일 토큰 폐기
+
+        :param jti: 토큰 ID
+        :param expire: 토큰 만료 시각 (timestamp), 이후 폐기 기록은 정리됨
+        :return:
+        """
+        self._bloom.add(jti)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zadd(self.jti_key, {jti: expire})
+            pipe.publish(self.channel, f'jti:{jti}')
+            await pipe.execute()
+
+    async def revoke_user(self, user_id: int, valid_after: int) -> None:
+        """
+        사용자가 valid_after 이전에 발급받은 모든 토큰 폐기
+
+        :param user_id: 사용자 ID
+        :param valid_after: 토큰 유효 시작 시각 (timestamp)
+        :return:
+        """
+        self._valid_after[user_id] = valid_after
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(self.user_key, str(user_id), valid_after)
+            pipe.publish(self.channel, f'user:{user_id}:{valid_after}')
+            await pipe.execute()
+
+    async def is_revoked(self, user_id: int, jti: str | None, iat: int) -> bool:
+        """
+        토큰 폐기 여부 확인
+
+        :param user_id: 사용자 ID
+        :param jti: 토큰 ID
+        :param iat: 토큰 발급 시각 (timestamp)
+        :return:
+        """
+        if iat < self._valid_after.get(user_id, 0):
+            return True
+        if not jti or jti not in self._bloom:
+            return False
+        # 블룸 필터 양성은 오탐일 수 있으므로 redis 로 확인
+        return await redis_client.zscore(self.jti_key, jti) is not None
+
+    def _handle(self, message: str) -> None:
+        kind, _, value = message.partition(':')
+        if kind == 'jti':
+            self._bloom.add(value)
+        elif kind == 'user':
+            user_id, _, valid_after = value.partition(':')
+            self._valid_after[int(user_id)] = max(int(valid_after), self._valid_after.get(int(user_id), 0))
+
+    async def _listen(self) -> None:
+        """pub/sub 메시지를 반영하고, 액세스 토큰 만료 주기마다 블룸 필터를 재구성"""
+        loop = asyncio.get_running_loop()
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # 구독 전후로 누락된 메시지가 없도록 다시 불러옴
+                await self.load()
+                rebuild_at = loop.time() + settings.TOKEN_STATELESS_EXPIRE_SECONDS
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message:
+                        self._handle(message['data'])
+                    if loop.time() >= rebuild_at:
+                        await self.load()
+                        rebuild_at = loop.time() + settings.TOKEN_STATELESS_EXPIRE_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f'토큰 폐기 목록 동기화 오류, 재연결합니다: {e}')
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+token_revocation = TokenRevocation()
@@ -92,6 +92,15 @@ class Settings(BaseSettings):
     DB_ECHO: bool = False
     DB_DATABASE: str = 'fba'
     DB_CHARSET: str = 'utf8mb4'
+    DB_POOL_SIZE: int = 10  # 연결 풀에 유지할 연결 수
+    DB_POOL_MAX_OVERFLOW: int = 20  # 풀 크기를 초과하여 추가로 생성할 수 있는 최대 연결 수
+    DB_POOL_TIMEOUT: float = 30  # 연결 체크아웃 최대 대기 시간，단위：초
+    DB_POOL_RECYCLE: int = 60 * 60  # 연결 재생성 주기, MySQL wait_timeout 보다 짧아야 함，단위：초
+    DB_POOL_PRE_PING: Literal['always', 'idle', 'never'] = 'idle'  # always: 매 체크아웃 ping; idle: 유휴 연결만 ping
+    DB_POOL_PRE_PING_IDLE_SECONDS: int = 30  # idle 모드에서 ping 할 유휴 시간，단위：초
+    DB_POOL_SLOW_CHECKOUT_MS: int = 100  # 체크아웃 대기 시간이 이 값 이상이면 경고 로그，단위：밀리초
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # SELECT 문 실행 제한 (max_execution_time), 0 은 제한 없음，단위：밀리초
+    DB_REPLICA_HOSTS: list[str] = []  # 읽기 전용 복제본 host:port 목록, 비어 있으면 모든 조회가 주 데이터베이스로
 
     # Redis
     REDIS_TIMEOUT: int = 5
@@ -106,10 +115,30 @@ class Settings(BaseSettings):
     TOKEN_EXCLUDE: list[str] = [  # JWT / RBAC 白名单
         f'{API_V1_STR}/auth/login',
     ]
+    # 무상태 모드: 액세스 토큰을 redis 에 저장하지 않고, 프로세스 내 폐기 목록(블룸 필터 + 사용자별 유효 시작 시각)으로 검증
+    TOKEN_STATELESS: bool = False
+    TOKEN_STATELESS_EXPIRE_SECONDS: int = 60 * 15  # 무상태 모드 액세스 토큰 만료 시간, 단위：초
+    TOKEN_REVOKE_REDIS_PREFIX: str = 'fba_token_revoke'
+    TOKEN_REVOKE_BLOOM_CAPACITY: int = 100000  # 블룸 필터 예상 폐기 토큰 수
+    TOKEN_REVOKE_BLOOM_ERROR_RATE: float = 0.001  # 블룸 필터 오탐률, 오탐 시에만 redis 조회
+
+    # Password
+    # 첫 번째 알고리즘으로 새 해시를 생성하며, 나머지 알고리즘은 검증만 하고 로그인 성공 시 재해시됩니다
+    PASSWORD_HASH_SCHEMES: list[Literal['bcrypt', 'argon2']] = ['bcrypt']
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # bcrypt 비용 (2^n 회 반복), 개발/테스트 환경에서는 낮게 설정 가능
+    PASSWORD_ARGON2_TIME_COST: int = 3  # argon2 반복 횟수
+    PASSWORD_ARGON2_MEMORY_COST: int = 65536  # argon2 메모리 사용량, 단위：KiB
+    PASSWORD_ARGON2_PARALLELISM: int = 4  # argon2 병렬 처리 수
 
     # Captcha
     CAPTCHA_LOGIN_REDIS_PREFIX: str = 'fba_login_captcha'
     CAPTCHA_LOGIN_EXPIRE_SECONDS: int = 60 * 5  # 过期时间，单位：秒
+    CAPTCHA_POOL: bool = True  # 백그라운드에서 인증 코드를 미리 생성하여 redis 리스트에 보관
+    CAPTCHA_POOL_REDIS_PREFIX: str = 'fba_captcha'
+    CAPTCHA_POOL_SIZE: int = 200  # 풀에 유지할 인증 코드 수
+    CAPTCHA_POOL_WORKERS: int = 2  # 생성용 프로세스 풀 크기
+    CAPTCHA_POOL_REFILL_BATCH: int = 20  # 프로세스 작업 하나당 생성 수
+    CAPTCHA_POOL_REFILL_INTERVAL: float = 1.0  # 보충 주기, 단위：초
 
     # Log
     LOG_STDOUT_FILENAME: str = 'fba_access.log'
@@ -155,10 +184,26 @@ class Settings(BaseSettings):
         'confirm_password',
     ]
 
+    # Log writer
+    LOG_WRITER_BATCH_SIZE: int = 100  # 한 번에 일괄 INSERT 할 최대 로그 수
+    LOG_WRITER_FLUSH_INTERVAL: float = 1.0  # 일괄 기록 최대 대기 시간, 단위：초
+    LOG_WRITER_QUEUE_MAXSIZE: int = 10000  # 큐가 가득 차면 새 로그는 버려짐
+
     # Ip location
     IP_LOCATION_REDIS_PREFIX: str = 'fba_ip_location'
     IP_LOCATION_EXPIRE_SECONDS: int = 60 * 60 * 24 * 1  # 过期时间，单位：秒
 
+    # Dict cache
+    DICT_CACHE_REDIS_PREFIX: str = 'fba_dict'
+    DICT_CACHE_EXPIRE_SECONDS: int = 60 * 60 * 24 * 1  # redis 스냅샷 만료 시간，단위：초
+    DICT_CACHE_LOCAL_TTL: float = 1.0  # 프로세스 내 스냅샷을 redis 버전과 대조하는 주기，단위：초
+
+    # Conditional GET
+    RESOURCE_VERSION_REDIS_PREFIX: str = 'fba_resource_version'
+
+    # Serializer
+    SERIALIZE_OFFLOAD_THRESHOLD: int = 2000  # 이 행 수를 초과하는 목록만 스레드 풀에서 직렬화
+
     # Celery
     CELERY_BROKER: Literal['rabbitmq', 'redis'] = 'redis'
     CELERY_BACKEND_REDIS_PREFIX: str = 'fba_celery'
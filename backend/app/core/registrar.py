@@ -8,8 +8,11 @@ from fastapi_pagination import add_pagination
 from starlette.middleware.authentication import AuthenticationMiddleware
 
 from backend.app.api.routers import v1
+from backend.app.common.batch_writer import login_log_writer
+from backend.app.common.captcha_pool import captcha_pool
 from backend.app.common.exception.exception_handler import register_exception
 from backend.app.common.redis import redis_client
+from backend.app.common.token_revocation import token_revocation
 from backend.app.core.conf import settings
 from backend.app.database.db_mysql import create_table
 from backend.app.middleware.jwt_auth_middleware import JwtAuthMiddleware
@@ -40,9 +43,25 @@ async def register_init(app: FastAPI):
         prefix=settings.LIMITER_REDIS_PREFIX,
         http_callback=http_limit_callback,
     )
+    # 무상태 토큰 폐기 목록 동기화
+    if settings.TOKEN_STATELESS:
+        await token_revocation.open()
+    # 로그 일괄 기록기 시작
+    await login_log_writer.start()
+    # 인증 코드 사전 생성 풀 시작
+    if settings.CAPTCHA_POOL:
+        await captcha_pool.start()
 
     yield
 
+    # 인증 코드 사전 생성 풀 종료
+    if settings.CAPTCHA_POOL:
+        await captcha_pool.stop()
+    # 로그 일괄 기록기 종료, 남은 로그 기록
+    await login_log_writer.stop()
+    # 무상태 토큰 폐기 목록 동기화 종료
+    if settings.TOKEN_STATELESS:
+        await token_revocation.close()
     # Redis 연결 종료
     await redis_client.close()
     # 리미터 종료
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from sqlalchemy import Select, and_, delete, desc, select
+from typing import Sequence
+
+from sqlalchemy import Select, and_, asc, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.app.crud.base import CRUDBase
 from backend.app.models.sys_dict_data import DictData
+from backend.app.models.sys_dict_type import DictType
 from backend.app.schemas.dict_data import CreateDictDataParam, UpdateDictDataParam
 
 
@@ -45,5 +48,20 @@ class CRUDDictData(CRUDBase[DictData, CreateDictDataParam, UpdateDictDataParam])
         dict_data = await db.execute(select(self.model).options(selectinload(self.model.type)).where(*where))
         return dict_data.scalars().first()
 
+    async def get_all_by_type_id(self, db: AsyncSession, type_id: int) -> Sequence[DictData]:
+        dict_datas = await db.execute(
+            select(self.model).where(self.model.type_id == type_id).order_by(asc(self.model.sort), asc(self.model.id))
+        )
+        return dict_datas.scalars().all()
+
+    async def get_type_codes(self, db: AsyncSession, pk: list[int]) -> Sequence[str]:
+        codes = await db.execute(
+            select(DictType.code)
+            .join(self.model, self.model.type_id == DictType.id)
+            .where(self.model.id.in_(pk))
+            .distinct()
+        )
+        return codes.scalars().all()
+
 
 dict_data_dao: CRUDDictData = CRUDDictData(DictData)
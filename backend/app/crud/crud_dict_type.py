@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+from typing import Sequence
+
 from sqlalchemy import Select, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,5 +41,9 @@ class CRUDDictType(CRUDBase[DictType, CreateDictTypeParam, UpdateDictTypeParam])
         apis = await db.execute(delete(self.model).where(self.model.id.in_(pk)))
         return apis.rowcount
 
+    async def get_codes(self, db: AsyncSession, pk: list[int]) -> Sequence[str]:
+        codes = await db.execute(select(self.model.code).where(self.model.id.in_(pk)))
+        return codes.scalars().all()
+
 
 dict_type_dao: CRUDDictType = CRUDDictType(DictType)
@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from datetime import datetime
+from typing import Literal
 
 from fast_captcha import text_captcha
-from sqlalchemy import and_, desc, select, update
+from sqlalchemy import JSON, and_, desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import Select
 
 from backend.app.common import jwt
 from backend.app.crud.base import CRUDBase
-from backend.app.models import Role, User
+from backend.app.models import Dept, Role, User
+from backend.app.models.sys_user_role import sys_user_role
 from backend.app.schemas.user import (
     AddUserParam,
     AvatarParam,
@@ -19,6 +21,19 @@ from backend.app.schemas.user import (
     UpdateUserRoleParam,
 )
 
+# 용도별 관계 로딩 전략, 응답 또는 처리에 실제로 필요한 관계만 로드
+#   none: 사용자 컬럼만 (정보 수정 등)
+#   roles: 역할 (역할 변경)
+#   full: 부서, 역할, 역할 메뉴 (JWT 인증의 현재 사용자, 사용자 상세)
+# 사용자 목록은 엔티티를 로드하지 않고 get_all 의 프로젝션 조회를 사용
+UserLoadType = Literal['none', 'roles', 'full']
+
+USER_LOADER_POLICY: dict[str, tuple] = {
+    'none': (),
+    'roles': (selectinload(User.roles),),
+    'full': (selectinload(User.dept), selectinload(User.roles).joinedload(Role.menus)),
+}
+
 
 class CRUDUser(CRUDBase[User, RegisterUserParam, UpdateUserParam]):
     async def get(self, db: AsyncSession, user_id: int) -> User | None:
@@ -44,7 +59,6 @@ class CRUDUser(CRUDBase[User, RegisterUserParam, UpdateUserParam]):
             .where(self.model.username == username)
             .values(last_login_time=login_time)
         )
-        await db.commit()
         return user.rowcount
 
     async def create(self, db: AsyncSession, obj: RegisterUserParam) -> None:
@@ -117,6 +131,16 @@ class CRUDUser(CRUDBase[User, RegisterUserParam, UpdateUserParam]):
         )
         return user.rowcount
 
+    async def update_password_hash(
+        self, db: AsyncSession, pk: int, hashed_password: str, new_hashed_password: str
+    ) -> int:
+        user = await db.execute(
+            update(self.model)
+            .where(self.model.id == pk, self.model.password == hashed_password)
+            .values(password=new_hashed_password)
+        )
+        return user.rowcount
+
     async def get_all(
         self,
         dept: int = None,
@@ -124,10 +148,37 @@ class CRUDUser(CRUDBase[User, RegisterUserParam, UpdateUserParam]):
         phone: str = None,
         status: int = None,
     ) -> Select:
+        """
+        사용자 목록 프로젝션 조회, 목록에 출력하는 컬럼과 부서 이름, 역할 이름 배열만 조회
+
+        페이지당 COUNT 와 본 조회 두 개의 SQL 만 실행되며, 엔티티와 관계는 로드하지 않습니다.
+        """
+        roles = (
+            select(func.coalesce(func.json_arrayagg(Role.name), func.json_array(), type_=JSON))
+            .join(sys_user_role, sys_user_role.c.role_id == Role.id)
+            .where(sys_user_role.c.user_id == self.model.id)
+            .scalar_subquery()
+        )
         se = (
-            select(self.model)
-            .options(selectinload(self.model.dept))
-            .options(selectinload(self.model.roles).selectinload(Role.menus))
+            select(
+                self.model.id,
+                self.model.uuid,
+                self.model.dept_id,
+                self.model.username,
+                self.model.nickname,
+                self.model.email,
+                self.model.phone,
+                self.model.avatar,
+                self.model.status,
+                self.model.is_superuser,
+                self.model.is_staff,
+                self.model.is_multi_login,
+                self.model.join_time,
+                self.model.last_login_time,
+                Dept.name.label('dept'),
+                roles.label('roles'),
+            )
+            .outerjoin(Dept, self.model.dept_id == Dept.id)
             .order_by(desc(self.model.join_time))
         )
         where_list = []
@@ -196,7 +247,12 @@ class CRUDUser(CRUDBase[User, RegisterUserParam, UpdateUserParam]):
         return user.rowcount
 
     async def get_with_relation(
-        self, db: AsyncSession, *, user_id: int = None, username: str = None
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int = None,
+        username: str = None,
+        load: UserLoadType = 'full',
     ) -> User | None:
         where = []
         if user_id:
@@ -204,10 +260,7 @@ class CRUDUser(CRUDBase[User, RegisterUserParam, UpdateUserParam]):
         if username:
             where.append(self.model.username == username)
         user = await db.execute(
-            select(self.model)
-            .options(selectinload(self.model.dept))
-            .options(selectinload(self.model.roles).joinedload(Role.menus))
-            .where(*where)
+            select(self.model).options(*USER_LOADER_POLICY[load]).where(*where)
         )
         return user.scalars().first()
 
@@ -2,33 +2,65 @@
 # -*- coding: utf-8 -*-
 import sys
 
-from typing import Annotated
+from typing import Annotated, Sequence
 from uuid import uuid4
 
 from fastapi import Depends
 from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from backend.app.common.log import log
 from backend.app.core.conf import settings
+from backend.app.database.db_pool import InstrumentedQueuePool, register_pool_events
+from backend.app.database.db_routing import ReplicaSet, RoutingSession
 from backend.app.models.base import MappedBase
 
 
-def create_engine_and_session(url: str | URL):
+def create_engine(url: str | URL) -> AsyncEngine:
     try:
         # 데이터베이스 엔진
+        connect_args = {}
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_args['init_command'] = f'SET SESSION max_execution_time = {settings.DB_STATEMENT_TIMEOUT_MS}'
         engine = create_async_engine(
-            url, echo=settings.DB_ECHO, future=True, pool_pre_ping=True
+            url,
+            echo=settings.DB_ECHO,
+            future=True,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING == 'always',
+            connect_args=connect_args,
         )
+        register_pool_events(engine)
         # log.success('데이터베이스 연결 성공')
     except Exception as e:
         log.error("❌ 데이터베이스 연결 실패 {}", e)
         sys.exit()
     else:
-        db_session = async_sessionmaker(
-            bind=engine, autoflush=False, expire_on_commit=False
-        )
-        return engine, db_session
+        return engine
+
+
+def create_engine_and_session(url: str | URL, replica_urls: Sequence[str | URL] = ()):
+    """
+    데이터베이스 엔진과 세션 팩토리 생성
+
+    :param url: 주 데이터베이스
+    :param replica_urls: 읽기 전용 복제본, 조회는 복제본으로 라운드 로빈 (RoutingSession 참조)
+    :return:
+    """
+    engine = create_engine(url)
+    replicas = ReplicaSet([create_engine(replica_url).sync_engine for replica_url in replica_urls])
+    db_session = async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+    )
+    return engine, db_session
 
 
 SQLALCHEMY_DATABASE_URL = (
@@ -36,7 +68,15 @@ SQLALCHEMY_DATABASE_URL = (
     f"{settings.DB_PORT}/{settings.DB_DATABASE}?charset={settings.DB_CHARSET}"
 )
 
-async_engine, async_db_session = create_engine_and_session(SQLALCHEMY_DATABASE_URL)
+SQLALCHEMY_REPLICA_DATABASE_URLS = [
+    f"mysql+asyncmy://{settings.DB_USER}:{settings.DB_PASSWORD}@{host}/{settings.DB_DATABASE}"
+    f"?charset={settings.DB_CHARSET}"
+    for host in settings.DB_REPLICA_HOSTS
+]
+
+async_engine, async_db_session = create_engine_and_session(
+    SQLALCHEMY_DATABASE_URL, SQLALCHEMY_REPLICA_DATABASE_URLS
+)
 
 
 async def get_db() -> AsyncSession:
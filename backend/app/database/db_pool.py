@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import bisect
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from backend.app.common.log import log
+from backend.app.core.conf import settings
+
+# 체크아웃 대기 시간 히스토그램 버킷 상한, 단위：밀리초
+CHECKOUT_WAIT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """연결 풀 지표, 체크아웃 대기 시간 히스토그램과 연결 이벤트 카운터"""
+
+    def __init__(self):
+        self.buckets = CHECKOUT_WAIT_BUCKETS
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.pings = 0
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, wait_ms)] += 1
+        self.wait_count += 1
+        self.wait_sum += wait_ms
+        if wait_ms > self.wait_max:
+            self.wait_max = wait_ms
+
+    def snapshot(self) -> dict:
+        """
+        누적 히스토그램, 마지막 버킷은 +Inf
+
+        :return:
+        """
+        histogram = []
+        cumulative = 0
+        for le, count in zip((*self.buckets, '+Inf'), self.bucket_counts):
+            cumulative += count
+            histogram.append({'le': le, 'count': cumulative})
+        return {
+            'checkout_wait': {
+                'histogram': histogram,
+                'count': self.wait_count,
+                'sum_ms': round(self.wait_sum, 3),
+                'max_ms': round(self.wait_max, 3),
+            },
+            'timeouts': self.timeouts,
+            'connects': self.connects,
+            'invalidations': self.invalidations,
+            'pings': self.pings,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    체크아웃 대기 시간을 측정하는 연결 풀
+
+    SQLAlchemy 풀 이벤트는 연결을 얻은 후에만 발생하므로, 대기 시간은 연결을 얻는 _do_get 을 감싸서 측정합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - start) * 1000
+            self.metrics.observe_wait(wait_ms)
+            if wait_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+                log.warning(
+                    f'데이터베이스 연결 체크아웃 지연 {wait_ms:.1f}ms, '
+                    f'사용 중 {self.checkedout()} / 풀 크기 {self.size()} / 오버플로 {self.overflow()}'
+                )
+
+    def status_snapshot(self) -> dict:
+        """
+        연결 풀 게이지와 지표
+
+        :return:
+        """
+        return {
+            'size': self.size(),
+            'max_overflow': self._max_overflow,
+            'checked_in': self.checkedin(),
+            'checked_out': self.checkedout(),
+            'overflow': max(self.overflow(), 0),
+            **self.metrics.snapshot(),
+        }
+
+
+def register_pool_events(engine: AsyncEngine) -> None:
+    """
+    연결 풀 이벤트 등록
+
+    DB_POOL_PRE_PING 이 idle 인 경우, DB_POOL_PRE_PING_IDLE_SECONDS 이상 유휴 상태였던 연결만 체크아웃 시 ping 하여
+    매 체크아웃마다 왕복이 추가되지 않도록 합니다.
+
+    :param engine:
+    :return:
+    """
+    sync_engine = engine.sync_engine
+    dialect = sync_engine.dialect
+
+    @event.listens_for(sync_engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info['checkin_at'] = time.monotonic()
+        metrics = getattr(sync_engine.pool, 'metrics', None)
+        if metrics:
+            metrics.connects += 1
+
+    @event.listens_for(sync_engine, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        connection_record.info['checkin_at'] = time.monotonic()
+
+    @event.listens_for(sync_engine, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics = getattr(sync_engine.pool, 'metrics', None)
+        if metrics:
+            metrics.invalidations += 1
+
+    if settings.DB_POOL_PRE_PING == 'idle':
+
+        @event.listens_for(sync_engine, 'checkout')
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            idle = time.monotonic() - connection_record.info.get('checkin_at', 0)
+            if idle < settings.DB_POOL_PRE_PING_IDLE_SECONDS:
+                return
+            metrics = getattr(sync_engine.pool, 'metrics', None)
+            if metrics:
+                metrics.pings += 1
+            try:
+                dialect.do_ping(dbapi_connection)
+            except Exception as e:
+                # 풀이 이 연결을 폐기하고 새 연결로 다시 체크아웃함
+                raise exc.DisconnectionError(f'유휴 연결 ping 실패: {e}') from e
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import itertools
+
+from contextvars import ContextVar
+from typing import Sequence
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+# 현재 요청에서 쓰기가 발생했는지 여부, 쓰기 후의 조회는 복제 지연을 피하기 위해 주 데이터베이스로 보냄
+# 요청마다 별도의 asyncio 태스크에서 처리되므로 요청 범위로 유지됨
+_primary_sticky: ContextVar[bool] = ContextVar('primary_sticky', default=False)
+
+
+def stick_to_primary() -> None:
+    """현재 요청의 이후 모든 조회를 주 데이터베이스로 보냄"""
+    _primary_sticky.set(True)
+
+
+class ReplicaSet:
+    """읽기 전용 복제본 엔진 모음, 라운드 로빈으로 선택"""
+
+    def __init__(self, engines: Sequence[Engine] = ()):
+        self.engines = list(engines)
+        self._cycle = itertools.cycle(self.engines)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def next(self) -> Engine:
+        return next(self._cycle)
+
+
+class RoutingSession(Session):
+    """
+    읽기 / 쓰기 분리 세션
+
+    - begin() 으로 시작한 세션, flush, INSERT / UPDATE / DELETE, SELECT ... FOR UPDATE: 주 데이터베이스
+    - 그 외 조회: 세션마다 라운드 로빈으로 선택한 복제본 하나, 복제본이 없으면 주 데이터베이스
+    - 요청 안에서 쓰기가 발생한 후의 조회: 주 데이터베이스 (read-your-writes)
+    """
+
+    def __init__(self, *args, replicas: ReplicaSet = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas or ReplicaSet()
+        self._use_primary = False
+        self._replica = None
+
+    def begin(self, nested: bool = False):
+        self._use_primary = True
+        return super().begin(nested=nested)
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kwargs):
+        if bind is not None or not self.replicas:
+            return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+        if self._flushing or (clause is not None and (clause.is_dml or getattr(clause, '_for_update_arg', None))):
+            _primary_sticky.set(True)
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._use_primary or _primary_sticky.get():
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._replica is None:
+            self._replica = self.replicas.next()
+        return self._replica
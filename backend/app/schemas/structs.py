@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답 전용 msgspec Struct
+
+각 Get*ListDetails pydantic 스키마와 같은 필드를 가지며, 빠른 응답 경로에서 pydantic 검증과
+jsonable_encoder 를 거치지 않고 SQLAlchemy 객체를 바로 변환하여 msgspec 으로 인코딩합니다.
+스키마 필드를 변경하면 여기도 함께 변경해야 합니다.
+
+E.g. ::
+
+    from backend.app.schemas import structs
+    from backend.app.utils.serializers import struct_convert
+
+    data = struct_convert(users, list[structs.GetUserInfoListDetails])
+    return await response_base.fast_success(data=data)
+"""
+from msgspec import UNSET, Struct, UnsetType
+
+from backend.app.utils.serializers import FormattedDateTime
+
+
+class GetApiListDetails(Struct):
+    id: int
+    name: str
+    method: str
+    path: str
+    remark: str | None
+    created_time: FormattedDateTime
+    updated_time: FormattedDateTime | None = None
+
+
+class GetDeptListDetails(Struct):
+    id: int
+    name: str
+    parent_id: int | None
+    sort: int
+    leader: str | None
+    phone: str | None
+    email: str | None
+    status: int
+    del_flag: bool
+    created_time: FormattedDateTime
+    updated_time: FormattedDateTime | None = None
+
+
+class GetDictTypeListDetails(Struct):
+    id: int
+    name: str
+    code: str
+    status: int
+    remark: str | None
+    created_time: FormattedDateTime
+    updated_time: FormattedDateTime | None = None
+
+
+class GetDictDataListDetails(Struct):
+    id: int
+    type_id: int
+    label: str
+    value: str
+    sort: int
+    status: int
+    remark: str | None
+    type: GetDictTypeListDetails
+    created_time: FormattedDateTime
+    updated_time: FormattedDateTime | None = None
+
+
+class GetLoginLogListDetails(Struct):
+    id: int
+    user_uuid: str
+    username: str
+    status: int
+    ip: str
+    country: str | None
+    region: str | None
+    city: str | None
+    user_agent: str
+    browser: str | None
+    os: str | None
+    device: str | None
+    msg: str
+    login_time: FormattedDateTime
+    created_time: FormattedDateTime
+
+
+class GetMenuListDetails(Struct):
+    id: int
+    title: str
+    name: str
+    parent_id: int | None
+    sort: int
+    icon: str | None
+    path: str | None
+    menu_type: int
+    component: str | None
+    perms: str | None
+    status: int
+    show: int
+    cache: int
+    remark: str | None
+    created_time: FormattedDateTime
+    updated_time: FormattedDateTime | None = None
+
+
+class GetMenuTreeDetails(GetMenuListDetails):
+    """메뉴 트리 노드, 하위 메뉴가 없으면 children 필드를 출력하지 않음"""
+
+    level: int = 0
+    children: 'list[GetMenuTreeDetails] | UnsetType' = UNSET
+
+
+class GetOperaLogListDetails(Struct):
+    id: int
+    username: str | None
+    method: str
+    title: str
+    path: str
+    ip: str
+    country: str | None
+    region: str | None
+    city: str | None
+    user_agent: str
+    os: str | None
+    browser: str | None
+    device: str | None
+    args: dict | None
+    status: int
+    code: str
+    msg: str | None
+    cost_time: float
+    opera_time: FormattedDateTime
+    created_time: FormattedDateTime
+
+
+class GetRoleListDetails(Struct):
+    id: int
+    name: str
+    data_scope: int
+    status: int
+    remark: str | None
+    menus: list[GetMenuListDetails]
+    created_time: FormattedDateTime
+    updated_time: FormattedDateTime | None = None
+
+
+class GetUserInfoNoRelationDetail(Struct):
+    id: int
+    uuid: str
+    dept_id: int | None
+    username: str
+    nickname: str
+    email: str
+    phone: str | None
+    avatar: str | None
+    status: int
+    is_superuser: bool
+    is_staff: bool
+    is_multi_login: bool
+    join_time: FormattedDateTime | None
+    last_login_time: FormattedDateTime | None = None
+
+
+class GetUserInfoListDetails(GetUserInfoNoRelationDetail):
+    dept: GetDeptListDetails | None = None
+    roles: list[GetRoleListDetails] = []
+
+
+class GetUserPageDetails(GetUserInfoNoRelationDetail):
+    """사용자 목록 항목, crud_user.get_all 프로젝션 조회 결과로 부서와 역할은 이름만 출력"""
+
+    dept: str | None = None
+    roles: list[str] = []
+
+
+class GetPolicyListDetails(Struct):
+    id: int
+    ptype: str
+    v0: str
+    v1: str
+    v2: str | None = None
+    v3: str | None = None
+    v4: str | None = None
+    v5: str | None = None
@@ -4,6 +4,7 @@ from typing import Sequence
 
 from sqlalchemy import Select
 
+from backend.app.common.conditional import resource_version
 from backend.app.common.exception import errors
 from backend.app.crud.crud_api import api_dao
 from backend.app.database.db_mysql import async_db_session
@@ -39,18 +40,21 @@ class ApiService:
             if api:
                 raise errors.ForbiddenError(msg="인터페이스가 이미 존재합니다")
             await api_dao.create(db, obj)
+        await resource_version.bump("api")
 
     @staticmethod
     async def update(*, pk: int, obj: UpdateApiParam) -> int:
         async with async_db_session.begin() as db:
             count = await api_dao.update(db, pk, obj)
-            return count
+        await resource_version.bump("api")
+        return count
 
     @staticmethod
     async def delete(*, pk: list[int]) -> int:
         async with async_db_session.begin() as db:
             count = await api_dao.delete(db, pk)
-            return count
+        await resource_version.bump("api")
+        return count
 
 
 api_service: ApiService = ApiService()
@@ -4,14 +4,16 @@ from datetime import datetime
 
 from fastapi import Request
 from fastapi.security import OAuth2PasswordRequestForm
-from starlette.background import BackgroundTask, BackgroundTasks
+from starlette.background import BackgroundTasks
 
 from backend.app.common import jwt
+from backend.app.common.conditional import resource_version
 from backend.app.common.enums import LoginLogStatusType
 from backend.app.common.exception import errors
 from backend.app.common.jwt import get_token
+from backend.app.common.log import log
 from backend.app.common.redis import redis_client
-from backend.app.common.response.response_code import CustomErrorCode
+from backend.app.common.token_revocation import token_revocation
 from backend.app.core.conf import settings
 from backend.app.crud.crud_user import user_dao
 from backend.app.database.db_mysql import async_db_session
@@ -22,12 +24,11 @@ from backend.app.utils.timezone import timezone
 
 
 class AuthService:
-    login_time = timezone.now()
-
     async def swagger_login(
-        self, *, form_data: OAuth2PasswordRequestForm
+        self, *, form_data: OAuth2PasswordRequestForm, background_tasks: BackgroundTasks
     ) -> tuple[str, User]:
-        async with async_db_session() as db:
+        login_time = timezone.now()
+        async with async_db_session.begin() as db:
             current_user = await user_dao.get_by_username(db, form_data.username)
             if not current_user:
                 raise errors.NotFoundError(msg="사용자가 존재하지 않습니다.")
@@ -39,15 +40,24 @@ class AuthService:
                 raise errors.AuthorizationError(
                     msg="사용자가 잠겨 있습니다. 로그인에 실패하였습니다."
                 )
-            # 로그인 시간 업데이트
-            await user_dao.update_login_time(db, form_data.username, self.login_time)
-            # 최신 사용자 정보 가져오기
-            user = await user_dao.get(db, current_user.id)
+            # 해시 정책이 변경된 경우 백그라운드에서 재해시
+            if jwt.password_needs_update(current_user.password):
+                background_tasks.add_task(
+                    self.rehash_password,
+                    pk=current_user.id,
+                    password=form_data.password + current_user.salt,
+                    hashed_password=current_user.password,
+                )
+            # 로그인 시간 업데이트, 다시 조회하지 않고 메모리 객체에 반영
+            await user_dao.update_login_time(db, form_data.username, login_time)
+            current_user.last_login_time = login_time
+            # 응답 후 (커밋 후) 사용자 리소스 버전 올리기
+            background_tasks.add_task(resource_version.bump, f"user:{current_user.id}")
             # 토큰 생성
             access_token, _ = await jwt.create_access_token(
-                str(user.id), multi_login=user.is_multi_login
+                str(current_user.id), multi_login=current_user.is_multi_login
             )
-            return access_token, user
+            return access_token, current_user
 
     async def login(
         self,
@@ -56,7 +66,8 @@ class AuthService:
         obj: AuthLoginParam,
         background_tasks: BackgroundTasks,
     ) -> tuple[str, str, datetime, datetime, User]:
-        async with async_db_session() as db:
+        login_time = timezone.now()
+        async with async_db_session.begin() as db:
             try:
                 current_user = await user_dao.get_by_username(db, obj.username)
                 if not current_user:
@@ -69,63 +80,77 @@ class AuthService:
                     raise errors.AuthorizationError(
                         msg="사용자가 잠겨 있습니다. 로그인에 실패하였습니다."
                     )
-                captcha_code = await redis_client.get(
-                    f"{settings.CAPTCHA_LOGIN_REDIS_PREFIX}:{request.state.ip}"
-                )
-                if not captcha_code:
-                    raise errors.AuthorizationError(
-                        msg="인증 코드가 만료되었습니다. 다시 가져오세요."
-                    )
-                if captcha_code.lower() != obj.captcha.lower():
-                    raise errors.CustomError(error=CustomErrorCode.CAPTCHA_ERROR)
-                await user_dao.update_login_time(db, obj.username, self.login_time)
-                user = await user_dao.get(db, current_user.id)
-                access_token, access_token_expire_time = await jwt.create_access_token(
-                    str(user.id), multi_login=user.is_multi_login
-                )
-                refresh_token, refresh_token_expire_time = (
-                    await jwt.create_refresh_token(
-                        str(user.id),
-                        access_token_expire_time,
-                        multi_login=user.is_multi_login,
-                    )
+                # 인증 코드 검증 및 삭제, 기존 토큰 무효화, 토큰 저장을 한 번의 redis 왕복으로 처리
+                (
+                    access_token,
+                    access_token_expire_time,
+                    refresh_token,
+                    refresh_token_expire_time,
+                ) = await jwt.create_login_token(
+                    str(current_user.id),
+                    captcha_key=f"{settings.CAPTCHA_LOGIN_REDIS_PREFIX}:{request.state.ip}",
+                    captcha=obj.captcha,
+                    multi_login=current_user.is_multi_login,
                 )
+                # MySQL 은 UPDATE ... RETURNING 을 지원하지 않으므로, 다시 조회하지 않고 메모리 객체에 반영
+                await user_dao.update_login_time(db, obj.username, login_time)
+                current_user.last_login_time = login_time
             except errors.NotFoundError as e:
                 raise errors.NotFoundError(msg=e.msg)
             except (errors.AuthorizationError, errors.CustomError) as e:
-                err_log_info = dict(
-                    db=db,
+                await LoginLogService.create(
                     request=request,
                     user=current_user,
-                    login_time=self.login_time,
+                    login_time=login_time,
                     status=LoginLogStatusType.fail.value,
                     msg=e.msg,
                 )
-                task = BackgroundTask(LoginLogService.create, **err_log_info)
-                raise errors.AuthorizationError(msg=e.msg, background=task)
+                raise errors.AuthorizationError(msg=e.msg)
             except Exception as e:
                 raise e
             else:
-                log_info = dict(
-                    db=db,
+                await LoginLogService.create(
                     request=request,
-                    user=user,
-                    login_time=self.login_time,
+                    user=current_user,
+                    login_time=login_time,
                     status=LoginLogStatusType.success.value,
                     msg="로그인 성공",
                 )
-                background_tasks.add_task(LoginLogService.create, **log_info)
-                await redis_client.delete(
-                    f"{settings.CAPTCHA_LOGIN_REDIS_PREFIX}:{request.state.ip}"
-                )
+                if jwt.password_needs_update(current_user.password):
+                    background_tasks.add_task(
+                        self.rehash_password,
+                        pk=current_user.id,
+                        password=obj.password + current_user.salt,
+                        hashed_password=current_user.password,
+                    )
+                background_tasks.add_task(resource_version.bump, f"user:{current_user.id}")
                 return (
                     access_token,
                     refresh_token,
                     access_token_expire_time,
                     refresh_token_expire_time,
-                    user,
+                    current_user,
                 )
 
+    @staticmethod
+    async def rehash_password(*, pk: int, password: str, hashed_password: str) -> None:
+        """
+        현재 해시 정책으로 비밀번호 재해시
+
+        :param pk: 사용자 ID
+        :param password: 소금이 포함된 평문 비밀번호
+        :param hashed_password: 검증에 사용된 기존 해시, 그 사이 비밀번호가 변경된 경우 덮어쓰지 않음
+        :return:
+        """
+        try:
+            new_hashed_password = await jwt.get_hash_password(password)
+            async with async_db_session.begin() as db:
+                await user_dao.update_password_hash(
+                    db, pk, hashed_password, new_hashed_password
+                )
+        except Exception as e:
+            log.exception(f"비밀번호 재해시 실패: {e}")
+
     @staticmethod
     async def new_token(
         *, request: Request, refresh_token: str
@@ -163,6 +188,15 @@ class AuthService:
     @staticmethod
     async def logout(*, request: Request) -> None:
         token = await get_token(request)
+        if settings.TOKEN_STATELESS:
+            if request.user.is_multi_login:
+                await jwt.revoke_token(token)
+            else:
+                # 현재 시각까지 발급된 모든 토큰 폐기
+                await token_revocation.revoke_user(
+                    request.user.id, int(timezone.now().timestamp()) + 1
+                )
+            return
         if request.user.is_multi_login:
             key = f"{settings.TOKEN_REDIS_PREFIX}:{request.user.id}:{token}"
             await redis_client.delete(key)
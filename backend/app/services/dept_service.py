@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 from typing import Any
 
+from backend.app.common.conditional import resource_version
 from backend.app.common.exception import errors
 from backend.app.crud.crud_dept import dept_dao
 from backend.app.database.db_mysql import async_db_session
@@ -45,6 +46,7 @@ class DeptService:
                 if not parent_dept:
                     raise errors.NotFoundError(msg="상위 부서가 존재하지 않습니다")
             await dept_dao.create(db, obj)
+        await resource_version.bump("dept")
 
     @staticmethod
     async def update(*, pk: int, obj: UpdateDeptParam) -> int:
@@ -64,7 +66,8 @@ class DeptService:
                     msg="자기 자신을 상위 부서로 설정할 수 없습니다"
                 )
             count = await dept_dao.update(db, pk, obj)
-            return count
+        await resource_version.bump("dept")
+        return count
 
     @staticmethod
     async def delete(*, pk: int) -> int:
@@ -80,7 +83,8 @@ class DeptService:
                     msg="하위 부서가 존재하여 삭제할 수 없습니다"
                 )
             count = await dept_dao.delete(db, pk)
-            return count
+        await resource_version.bump("dept")
+        return count
 
 
 dept_service: DeptService = DeptService()
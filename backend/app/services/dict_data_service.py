@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 from sqlalchemy import Select
 
+from backend.app.common.dict_cache import DictSnapshot, dict_cache
 from backend.app.common.exception import errors
 from backend.app.crud.crud_dict_data import dict_data_dao
 from backend.app.crud.crud_dict_type import dict_type_dao
@@ -19,6 +20,13 @@ class DictDataService:
                 raise errors.NotFoundError(msg="사전 데이터가 존재하지 않습니다.")
             return dict_data
 
+    @staticmethod
+    async def get_by_type_code(*, code: str) -> DictSnapshot:
+        snapshot = await dict_cache.get(code)
+        if not snapshot:
+            raise errors.NotFoundError(msg="사전 유형이 존재하지 않습니다.")
+        return snapshot
+
     @staticmethod
     async def get_select(
         *, label: str = None, value: str = None, status: int = None
@@ -35,6 +43,7 @@ class DictDataService:
             if not dict_type:
                 raise errors.ForbiddenError(msg="사전 유형이 존재하지 않습니다.")
             await dict_data_dao.create(db, obj)
+        await dict_cache.invalidate(dict_type.code)
 
     @staticmethod
     async def update(*, pk: int, obj: UpdateDictDataParam) -> int:
@@ -48,14 +57,18 @@ class DictDataService:
             dict_type = await dict_type_dao.get(db, obj.type_id)
             if not dict_type:
                 raise errors.ForbiddenError(msg="사전 유형이 존재하지 않습니다.")
+            codes = {dict_type.code, *await dict_data_dao.get_type_codes(db, [pk])}
             count = await dict_data_dao.update(db, pk, obj)
-            return count
+        await dict_cache.invalidate(*codes)
+        return count
 
     @staticmethod
     async def delete(*, pk: list[int]) -> int:
         async with async_db_session.begin() as db:
+            codes = await dict_data_dao.get_type_codes(db, pk)
             count = await dict_data_dao.delete(db, pk)
-            return count
+        await dict_cache.invalidate(*codes)
+        return count
 
 
 dict_data_service: DictDataService = DictDataService()
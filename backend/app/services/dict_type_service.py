@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 from sqlalchemy import Select
 
+from backend.app.common.dict_cache import dict_cache
 from backend.app.common.exception import errors
 from backend.app.crud.crud_dict_type import dict_type_dao
 from backend.app.database.db_mysql import async_db_session
@@ -33,13 +34,16 @@ class DictTypeService:
                 if await dict_type_dao.get_by_code(db, obj.code):
                     raise errors.ForbiddenError(msg="사전 유형이 이미 존재합니다.")
             count = await dict_type_dao.update(db, pk, obj)
-            return count
+        await dict_cache.invalidate(dict_type.code, obj.code)
+        return count
 
     @staticmethod
     async def delete(*, pk: list[int]) -> int:
         async with async_db_session.begin() as db:
+            codes = await dict_type_dao.get_codes(db, pk)
             count = await dict_type_dao.delete(db, pk)
-            return count
+        await dict_cache.invalidate(*codes)
+        return count
 
 
 dict_type_service: DictTypeService = DictTypeService()
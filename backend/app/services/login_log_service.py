@@ -4,8 +4,8 @@ from datetime import datetime
 
 from fastapi import Request
 from sqlalchemy import Select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.common.batch_writer import login_log_writer
 from backend.app.common.log import log
 from backend.app.crud.crud_login_log import login_log_dao
 from backend.app.database.db_mysql import async_db_session
@@ -21,7 +21,6 @@ class LoginLogService:
     @staticmethod
     async def create(
         *,
-        db: AsyncSession,
         request: Request,
         user: User,
         login_time: datetime,
@@ -45,7 +44,8 @@ class LoginLogService:
                 msg=msg,
                 login_time=login_time,
             )
-            await login_log_dao.create(db, obj_in)
+            # 백그라운드 일괄 기록기로 전달, 요청 경로에서 DB 연결을 사용하지 않음
+            login_log_writer.put(obj_in)
         except Exception as e:
             log.exception(f"로그인 로그 생성 실패: {e}")
 
@@ -4,6 +4,7 @@ from typing import Any
 
 from fastapi import Request
 
+from backend.app.common.conditional import resource_version
 from backend.app.common.exception import errors
 from backend.app.common.redis import redis_client
 from backend.app.core.conf import settings
@@ -70,6 +71,7 @@ class MenuService:
                 if not parent_menu:
                     raise errors.NotFoundError(msg="상위 메뉴가 없습니다")
             await menu_dao.create(db, obj)
+        await resource_version.bump("menu")
 
     @staticmethod
     async def update(*, pk: int, obj: UpdateMenuParam) -> int:
@@ -90,7 +92,8 @@ class MenuService:
                 )
             count = await menu_dao.update(db, pk, obj)
             await redis_client.delete_prefix(settings.PERMISSION_REDIS_PREFIX)
-            return count
+        await resource_version.bump("menu")
+        return count
 
     @staticmethod
     async def delete(*, pk: int) -> int:
@@ -99,7 +102,8 @@ class MenuService:
             if children:
                 raise errors.ForbiddenError(msg="하위 메뉴가 있어 삭제할 수 없습니다")
             count = await menu_dao.delete(db, pk)
-            return count
+        await resource_version.bump("menu")
+        return count
 
 
 menu_service: MenuService = MenuService()
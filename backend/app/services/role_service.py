@@ -5,6 +5,7 @@ from typing import Sequence
 from fastapi import Request
 from sqlalchemy import Select
 
+from backend.app.common.conditional import resource_version
 from backend.app.common.exception import errors
 from backend.app.common.redis import redis_client
 from backend.app.core.conf import settings
@@ -53,6 +54,7 @@ class RoleService:
             if role:
                 raise errors.ForbiddenError(msg="역할이 이미 존재합니다.")
             await role_dao.create(db, obj)
+        await resource_version.bump("role")
 
     @staticmethod
     async def update(*, pk: int, obj: UpdateRoleParam) -> int:
@@ -65,7 +67,8 @@ class RoleService:
                 if role:
                     raise errors.ForbiddenError(msg="역할이 이미 존재합니다.")
             count = await role_dao.update(db, pk, obj)
-            return count
+        await resource_version.bump("role")
+        return count
 
     @staticmethod
     async def update_role_menu(
@@ -83,13 +86,15 @@ class RoleService:
             await redis_client.delete_prefix(
                 f"{settings.PERMISSION_REDIS_PREFIX}:{request.user.uuid}"
             )
-            return count
+        await resource_version.bump("role")
+        return count
 
     @staticmethod
     async def delete(*, pk: list[int]) -> int:
         async with async_db_session.begin() as db:
             count = await role_dao.delete(db, pk)
-            return count
+        await resource_version.bump("role")
+        return count
 
 
 role_service: RoleService = RoleService()
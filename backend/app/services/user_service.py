@@ -5,6 +5,7 @@ import random
 from fastapi import Request
 from sqlalchemy import Select
 
+from backend.app.common.conditional import resource_version
 from backend.app.common.exception import errors
 from backend.app.common.jwt import get_token, password_verify, superuser_verify
 from backend.app.common.redis import redis_client
@@ -106,7 +107,7 @@ class UserService:
             if not request.user.is_superuser:
                 if request.user.username != username:
                     raise errors.ForbiddenError(msg="자신의 정보만 수정할 수 있습니다")
-            input_user = await user_dao.get_with_relation(db, username=username)
+            input_user = await user_dao.get_with_relation(db, username=username, load="none")
             if not input_user:
                 raise errors.NotFoundError(msg="사용자가 존재하지 않습니다")
             if input_user.username != obj.username:
@@ -122,7 +123,8 @@ class UserService:
                 if email:
                     raise errors.ForbiddenError(msg="해당 이메일은 이미 등록되었습니다")
             count = await user_dao.update_userinfo(db, input_user, obj)
-            return count
+        await resource_version.bump(f"user:{input_user.id}")
+        return count
 
     @staticmethod
     async def update_roles(
@@ -132,7 +134,7 @@ class UserService:
             if not request.user.is_superuser:
                 if request.user.username != username:
                     raise errors.ForbiddenError(msg="자신의 역할만 수정할 수 있습니다")
-            input_user = await user_dao.get_with_relation(db, username=username)
+            input_user = await user_dao.get_with_relation(db, username=username, load="roles")
             if not input_user:
                 raise errors.NotFoundError(msg="사용자가 존재하지 않습니다")
             for role_id in obj.roles:
@@ -143,6 +145,7 @@ class UserService:
             await redis_client.delete_prefix(
                 f"{settings.PERMISSION_REDIS_PREFIX}:{request.user.uuid}"
             )
+        await resource_version.bump(f"user:{input_user.id}")
 
     @staticmethod
     async def update_avatar(
@@ -156,7 +159,8 @@ class UserService:
             if not input_user:
                 raise errors.NotFoundError(msg="사용자가 존재하지 않습니다")
             count = await user_dao.update_avatar(db, input_user, avatar)
-            return count
+        await resource_version.bump(f"user:{input_user.id}")
+        return count
 
     @staticmethod
     async def get_select(
@@ -176,7 +180,8 @@ class UserService:
                 if pk == request.user.id:
                     raise errors.ForbiddenError(msg="자체 관리자 권한을 수정할 수 없습니다")
                 count = await user_dao.set_super(db, pk)
-                return count
+        await resource_version.bump(f"user:{pk}")
+        return count
 
     @staticmethod
     async def update_staff(*, request: Request, pk: int) -> int:
@@ -188,7 +193,8 @@ class UserService:
                 if pk == request.user.id:
                     raise errors.ForbiddenError(msg="자체 백엔드 관리 로그인 권한을 수정할 수 없습니다")
                 count = await user_dao.set_staff(db, pk)
-                return count
+        await resource_version.bump(f"user:{pk}")
+        return count
 
     @staticmethod
     async def update_status(*, request: Request, pk: int) -> int:
@@ -203,7 +209,8 @@ class UserService:
                 if pk == request.user.id:
                     raise errors.ForbiddenError(msg="자체 상태를 수정할 수 없습니다")
                 count = await user_dao.set_status(db, pk)
-                return count
+        await resource_version.bump(f"user:{pk}")
+        return count
 
     @staticmethod
     async def update_multi_login(*, request: Request, pk: int) -> int:
@@ -227,7 +234,8 @@ class UserService:
                     if not latest_multi_login:
                         prefix = f"{settings.TOKEN_REDIS_PREFIX}:{pk}:"
                         await redis_client.delete_prefix(prefix)
-                return count
+        await resource_version.bump(f"user:{pk}")
+        return count
 
     @staticmethod
     async def delete(*, username: str) -> int:
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import asyncio
+
 from starlette.testclient import TestClient
 
+from backend.app.common import jwt
+from backend.app.common.exception.errors import TokenError
 from backend.app.core.conf import settings
 from backend.app.tests.conftest import PYTEST_PASSWORD, PYTEST_USERNAME
 
@@ -20,3 +24,16 @@ def test_logout(client: TestClient, token_headers: dict[str, str]) -> None:
     response = client.post(f'{settings.API_V1_STR}/auth/logout', headers=token_headers)
     assert response.status_code == 200
     assert response.json()['code'] == 200
+
+
+def test_new_token_concurrent(client: TestClient) -> None:
+    async def refresh_concurrently() -> list:
+        refresh_token, _ = await jwt.create_refresh_token('1', multi_login=True)
+        return await asyncio.gather(
+            *[jwt.create_new_token('1', 'pytest', refresh_token, multi_login=True) for _ in range(10)],
+            return_exceptions=True,
+        )
+
+    results = client.portal.call(refresh_concurrently)
+    assert len([result for result in results if not isinstance(result, Exception)]) == 1
+    assert all(isinstance(result, TokenError) for result in results if isinstance(result, Exception))
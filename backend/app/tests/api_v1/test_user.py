@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from sqlalchemy import event
+from starlette.testclient import TestClient
+
+from backend.app.core.conf import settings
+from backend.app.crud.crud_user import user_dao
+from backend.app.tests.utils.db_mysql import test_async_db_session, test_async_engine
+
+PAGE_SIZE = 20
+
+
+def test_get_pagination_users_statements(client: TestClient, token_headers: dict[str, str]) -> None:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(test_async_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get(f'{settings.API_V1_STR}/users?page=1&size={PAGE_SIZE}', headers=token_headers)
+    finally:
+        event.remove(test_async_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 200
+    items = response.json()['data']['items']
+    assert all(isinstance(role, str) for item in items for role in item['roles'])
+    # COUNT 와 본 조회만 실행, 역할 메뉴 등 관계 로딩 없음
+    assert len(statements) == 2
+    assert not any('sys_menu' in statement for statement in statements)
+
+
+def test_get_pagination_users_bytes_fetched(client: TestClient) -> None:
+    async def fetch_page() -> list:
+        async with test_async_db_session() as db:
+            result = await db.execute((await user_dao.get_all()).limit(PAGE_SIZE))
+            return result.all()
+
+    rows = client.portal.call(fetch_page)
+    fetched = sum(len(str(value).encode()) for row in rows for value in row)
+    # 목록 출력 컬럼만 조회하므로 행당 1KB 를 넘지 않아야 함
+    assert fetched <= 1024 * max(len(rows), 1)
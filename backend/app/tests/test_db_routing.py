@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import asyncio
+
+from sqlalchemy import select
+
+from backend.app.database.db_routing import _primary_sticky
+from backend.app.models import DictType
+from backend.app.models.base import MappedBase
+
+
+def test_read_replica_routing(tmp_path) -> None:
+    """주 데이터베이스와 복제본 두 개를 별도의 SQLite 파일로 만들고, 복제는 하지 않아 어디서 읽었는지 구분"""
+    from backend.app.database.db_mysql import create_engine_and_session
+
+    urls = [f'sqlite+aiosqlite:///{tmp_path / name}.db' for name in ('primary', 'replica1', 'replica2')]
+
+    async def run() -> list:
+        engine, db_session = create_engine_and_session(urls[0], urls[1:])
+        replicas = db_session.kw['replicas'].engines
+        for e in (engine.sync_engine, *replicas):
+            async with engine.__class__(e).begin() as conn:
+                await conn.run_sync(MappedBase.metadata.create_all, tables=[DictType.__table__])
+
+        async def read_names() -> list[str]:
+            async with db_session() as db:
+                return list((await db.scalars(select(DictType.name))).all())
+
+        # 요청마다 별도의 컨텍스트 (태스크)
+        async def request(write: bool) -> list:
+            results = [await read_names()]
+            if write:
+                async with db_session.begin() as db:
+                    db.add(DictType(name='primary', code='primary', status=1))
+                results.append(await read_names())
+            return results
+
+        results = [
+            await asyncio.create_task(request(write=False)),
+            await asyncio.create_task(request(write=True)),
+            await asyncio.create_task(request(write=False)),
+        ]
+        for e in (engine, *replicas):
+            await e.dispose()
+        return results
+
+    results = asyncio.run(run())
+    # 조회는 비어 있는 복제본으로, 쓰기 후 같은 요청의 조회는 주 데이터베이스로, 다음 요청은 다시 복제본으로
+    assert results == [[[]], [[], ['primary']], [[]]]
+    assert _primary_sticky.get() is False
@@ -1,47 +1,141 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, Sequence, TypeVar
+from operator import attrgetter
+from typing import Any, Callable, Sequence, TypeVar
 
 import msgspec
 
 from asgiref.sync import sync_to_async
 from sqlalchemy import Row, RowMapping
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
 
+from backend.app.core.conf import settings
+
 RowData = Row | RowMapping | Any
 
 R = TypeVar('R', bound=RowData)
 
+S = TypeVar('S')
 
-@sync_to_async
-def select_columns_serialize(row: R) -> dict:
+
+def _column_python_type(column: Any) -> type | None:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _decimal_to_number(val: Decimal) -> float:
+    if val % 1 == 0:
+        val = int(val)
+    return float(val)
+
+
+def _compile_columns_serializer(model: type) -> Callable[[Any], dict]:
     """
-    Serialize SQLAlchemy select table columns, does not contain relational columns
+    Build a row serializer for a mapped class, column keys and getters are resolved once
 
-    :param row:
+    :param model:
     :return:
     """
-    obj_dict = {}
-    for column in row.__table__.columns.keys():
-        val = getattr(row, column)
+    columns = model.__table__.columns
+    keys = tuple(columns.keys())
+    decimal_keys = tuple(k for k in keys if _column_python_type(columns[k]) is Decimal)
+    getter = attrgetter(*keys)
+    if len(keys) == 1:
+        key = keys[0]
+
+        def serialize(row: Any) -> dict:
+            return {key: getter(row)}
+
+    else:
+
+        def serialize(row: Any) -> dict:
+            return dict(zip(keys, getter(row)))
+
+    if not decimal_keys:
+        return serialize
+
+    def serialize_with_decimal(row: Any) -> dict:
+        obj_dict = serialize(row)
+        for k in decimal_keys:
+            val = obj_dict[k]
+            if isinstance(val, Decimal):
+                obj_dict[k] = _decimal_to_number(val)
+        return obj_dict
+
+    return serialize_with_decimal
+
+
+_columns_serializers: dict[type, Callable[[Any], dict]] = {}
+
+
+def _row_serialize(row: Any) -> dict:
+    """Serialize Row / RowMapping from select(*columns)"""
+    obj_dict = dict(row._mapping) if isinstance(row, Row) else dict(row)
+    for k, val in obj_dict.items():
         if isinstance(val, Decimal):
-            if val % 1 == 0:
-                val = int(val)
-            val = float(val)
-        obj_dict[column] = val
+            obj_dict[k] = _decimal_to_number(val)
     return obj_dict
 
 
+def get_columns_serializer(model: type) -> Callable[[Any], dict]:
+    """
+    Get the cached row serializer for a mapped class, Row / RowMapping use a generic serializer
+
+    :param model:
+    :return:
+    """
+    serializer = _columns_serializers.get(model)
+    if serializer is None:
+        if issubclass(model, (Row, RowMapping)):
+            serializer = _row_serialize
+        else:
+            serializer = _compile_columns_serializer(model)
+        _columns_serializers[model] = serializer
+    return serializer
+
+
+def columns_serialize(rows: Sequence[R]) -> list[dict]:
+    """
+    Serialize SQLAlchemy select list synchronously in a tight loop
+
+    :param rows:
+    :return:
+    """
+    ret_list = []
+    model = serializer = None
+    for row in rows:
+        if type(row) is not model:
+            model = type(row)
+            serializer = get_columns_serializer(model)
+        ret_list.append(serializer(row))
+    return ret_list
+
+
+async def select_columns_serialize(row: R) -> dict:
+    """
+    Serialize SQLAlchemy select table columns, does not contain relational columns
+
+    :param row:
+    :return:
+    """
+    return get_columns_serializer(type(row))(row)
+
+
 async def select_list_serialize(row: Sequence[R]) -> list:
     """
-    Serialize SQLAlchemy select list
+    Serialize SQLAlchemy select list, offloaded to the thread pool only above SERIALIZE_OFFLOAD_THRESHOLD rows
 
     :param row:
     :return:
     """
-    ret_list = [await select_columns_serialize(_) for _ in row]
-    return ret_list
+    if len(row) > settings.SERIALIZE_OFFLOAD_THRESHOLD:
+        return await run_in_threadpool(columns_serialize, row)
+    return columns_serialize(row)
 
 
 @sync_to_async
@@ -59,10 +153,49 @@ def select_as_dict(row: R) -> dict:
         return obj_dict
 
 
+class FormattedDateTime(str):
+    """
+    Datetime field type for msgspec Struct, formatted with settings.DATETIME_FORMAT when converted
+    """
+
+
+def _format_datetime(obj: datetime) -> str:
+    # isoformat is about 3x faster than strftime for the default format
+    if settings.DATETIME_FORMAT == '%Y-%m-%d %H:%M:%S':
+        return obj.isoformat(' ', 'seconds')[:19]
+    return obj.strftime(settings.DATETIME_FORMAT)
+
+
+def msgspec_dec_hook(type_: type, obj: Any) -> Any:
+    if type_ is FormattedDateTime and isinstance(obj, datetime):
+        return FormattedDateTime(_format_datetime(obj))
+    raise NotImplementedError(f'Objects of type {type(obj)} can not be converted to {type_}')
+
+
+def msgspec_enc_hook(obj: Any) -> Any:
+    if isinstance(obj, FormattedDateTime):
+        return str(obj)
+    raise NotImplementedError(f'Objects of type {type(obj)} are not supported')
+
+
+def struct_convert(obj: Any, type_: type[S]) -> S:
+    """
+    Convert SQLAlchemy select (or its list / dict) to msgspec Struct in one pass, without pydantic validation
+
+    :param obj:
+    :param type_: Struct type, e.g. list[GetUserInfoListDetails]
+    :return:
+    """
+    return msgspec.convert(obj, type_, from_attributes=True, dec_hook=msgspec_dec_hook)
+
+
+_encoder = msgspec.json.Encoder(enc_hook=msgspec_enc_hook)
+
+
 class MsgSpecJSONResponse(JSONResponse):
     """
     JSON response using the high-performance msgspec library to serialize data to JSON.
     """
 
     def render(self, content: Any) -> bytes:
-        return msgspec.json.encode(content)
+        return _encoder.encode(content)